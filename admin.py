@@ -1,59 +1,108 @@
 """Admin command handlers for Telegram bot."""
-from datetime import datetime, timedelta
-from aiogram import Router, F
+import asyncio
+from functools import lru_cache
+from aiogram import Router
 from aiogram.filters import Command
 from aiogram.types import Message
 
 from settings import get_settings
-from config_loader import get_config, get_config_loader
+from config_loader import get_config_loader
 from db_pkg import get_session, NewsRepository, SignalRepository, SubscriberRepository, ConfigRepository
 from logging_setup import get_logger
 
 logger = get_logger("bot.admin")
 router = Router(name="admin")
 
+# Static admin texts, built once at import
+ADMIN_PANEL_HTML = (
+    "🔧 <b>Панель администратора</b>\n\n"
+    "<b>Статистика:</b>\n"
+    "• /stats — статистика за сутки\n"
+    "• /report_week — недельный отчёт\n"
+    "• /health — статус системы\n\n"
+    "<b>Источники:</b>\n"
+    "• /sources_list — список источников\n"
+    "• /sources_add {url} {name} — добавить\n"
+    "• /sources_remove {name} — удалить\n\n"
+    "<b>Конфигурация:</b>\n"
+    "• /config_show — текущие настройки\n"
+    "• /config_set {path} {value} — изменить\n"
+    "• /reload_config — перечитать конфиг\n\n"
+    "<b>Тестирование:</b>\n"
+    "• /test_signal — тестовый сигнал (только вам)\n\n"
+    "<b>Рассылка:</b>\n"
+    "• /broadcast {text} — разослать всем"
+)
+
+STATS_TEMPLATE = (
+    "📊 <b>Статистика</b>\n\n"
+    "<b>За сутки:</b>\n"
+    "• Собрано: {daily_total}\n"
+    "• Отправлено: {signals_today}\n\n"
+    "<b>Отфильтровано:</b>\n"
+    "• Старые: {filtered_old}\n"
+    "• Завершённые: {filtered_resolved}\n"
+    "• Шум: {filtered_noise}\n"
+    "• Дубли: {duplicate}\n"
+    "• Фильтр1: {filtered}\n"
+    "• LLM ошибки: {llm_failed}\n"
+    "• LLM пропущен: {llm_skipped}\n"
+    "• Лимит: {suppressed_limit}\n\n"
+    "<b>За неделю:</b>\n"
+    "• Собрано: {weekly_total}\n"
+    "• Сигналов: {weekly_sent}\n\n"
+    "<b>Подписчики:</b> {subscribers}"
+)
+
+# Keys editable via /config_set (ordered for the help text, frozenset for lookup)
+CONFIG_SET_KEYS_ORDERED = (
+    "thresholds.filter1_to_llm",
+    "thresholds.llm_relevance",
+    "thresholds.llm_urgency",
+    "limits.max_signals_per_day",
+    "dedup.simhash_threshold",
+    "schedule.check_interval_minutes",
+)
+CONFIG_SET_KEYS = frozenset(CONFIG_SET_KEYS_ORDERED)
+
+SOURCE_STATUS_ICON = {True: "🟢", False: "🔴"}
+
+
+@lru_cache(maxsize=1)
+def _admin_chat_id() -> int:
+    """Admin chat ID, resolved once (cleared on /reload_config)."""
+    return get_settings().admin_chat_id
+
 
 def is_admin(message: Message) -> bool:
     """Check if message is from admin."""
-    settings = get_settings()
-    return message.chat.id == settings.admin_chat_id
+    return message.chat.id == _admin_chat_id()
+
+
+# Single admin gate for the whole router: non-admin messages never reach
+# the handlers below and fall through to the other routers.
+router.message.filter(is_admin)
+
+
+async def _read(query, *args, **kwargs):
+    """Run a single read-only repository call in its own session.
+
+    Each call gets a separate pooled connection so independent reads
+    can be awaited concurrently with asyncio.gather.
+    """
+    async with get_session() as session:
+        return await query(session, *args, **kwargs)
 
 
 @router.message(Command("admin"))
 async def cmd_admin(message: Message):
     """Show admin panel."""
-    if not is_admin(message):
-        await message.answer("❌ Команда недоступна.")
-        return
-    
-    await message.answer(
-        "🔧 <b>Панель администратора</b>\n\n"
-        "<b>Статистика:</b>\n"
-        "• /stats — статистика за сутки\n"
-        "• /report_week — недельный отчёт\n"
-        "• /health — статус системы\n\n"
-        "<b>Источники:</b>\n"
-        "• /sources_list — список источников\n"
-        "• /sources_add {url} {name} — добавить\n"
-        "• /sources_remove {name} — удалить\n\n"
-        "<b>Конфигурация:</b>\n"
-        "• /config_show — текущие настройки\n"
-        "• /config_set {path} {value} — изменить\n"
-        "• /reload_config — перечитать конфиг\n\n"
-        "<b>Тестирование:</b>\n"
-        "• /test_signal — тестовый сигнал (только вам)\n\n"
-        "<b>Рассылка:</b>\n"
-        "• /broadcast {text} — разослать всем",
-        parse_mode="HTML"
-    )
+    await message.answer(ADMIN_PANEL_HTML, parse_mode="HTML")
 
 
 @router.message(Command("set_llm_key"))
 async def cmd_set_llm_key(message: Message):
     """Set LLM API key override."""
-    if not is_admin(message):
-        return
-
     try:
         args = message.text.split(maxsplit=1)
         if len(args) < 2:
@@ -63,13 +112,11 @@ async def cmd_set_llm_key(message: Message):
         new_key = args[1].strip()
         
         # Save to DB overrides
-        from db_pkg import ConfigRepository, get_session
         async with get_session() as session:
             await ConfigRepository.set(session, "openrouter_api_key", new_key, message.chat.id)
             await session.commit()
             
         # Update loader runtime
-        from config_loader import get_config_loader
         loader = get_config_loader()
         loader.set_overrides({"openrouter_api_key": new_key})
         
@@ -87,48 +134,33 @@ async def cmd_set_llm_key(message: Message):
 @router.message(Command("stats"))
 async def cmd_stats(message: Message):
     """Show daily/weekly stats with filter breakdown."""
-    if not is_admin(message):
-        await message.answer("❌ Команда недоступна.")
-        return
-    
     logger.info("admin_action", action="stats", admin_id=message.chat.id)
     
-    async with get_session() as session:
-        # Daily stats
-        daily = await NewsRepository.get_stats(session, days=1)
-        
-        # Weekly stats
-        weekly = await NewsRepository.get_stats(session, days=7)
-        
-        # Signals today
-        signals_today = await SignalRepository.count_today(session)
-        
-        # Subscribers
-        subscribers_count = await SubscriberRepository.count_active(session)
-    
-    # Build filter breakdown
-    d = daily.get("by_decision", {})
-    breakdown = (
-        f"• Старые: {d.get('filtered_old', 0)}\n"
-        f"• Завершённые: {d.get('filtered_resolved', 0)}\n"
-        f"• Шум: {d.get('filtered_noise', 0)}\n"
-        f"• Дубли: {d.get('duplicate', 0)}\n"
-        f"• Фильтр1: {d.get('filtered', 0)}\n"
-        f"• LLM ошибки: {d.get('llm_failed', 0)}\n"
-        f"• LLM пропущен: {d.get('llm_skipped', 0)}\n"
-        f"• Лимит: {d.get('suppressed_limit', 0)}"
+    # Independent reads - run concurrently
+    daily, weekly, signals_today, subscribers_count = await asyncio.gather(
+        _read(NewsRepository.get_stats, days=1),
+        _read(NewsRepository.get_stats, days=7),
+        _read(SignalRepository.count_today),
+        _read(SubscriberRepository.count_active),
     )
     
+    d = daily.get("by_decision", {})
     await message.answer(
-        f"📊 <b>Статистика</b>\n\n"
-        f"<b>За сутки:</b>\n"
-        f"• Собрано: {daily.get('total', 0)}\n"
-        f"• Отправлено: {signals_today}\n\n"
-        f"<b>Отфильтровано:</b>\n{breakdown}\n\n"
-        f"<b>За неделю:</b>\n"
-        f"• Собрано: {weekly.get('total', 0)}\n"
-        f"• Сигналов: {weekly.get('sent', 0)}\n\n"
-        f"<b>Подписчики:</b> {subscribers_count}",
+        STATS_TEMPLATE.format(
+            daily_total=daily.get("total", 0),
+            signals_today=signals_today,
+            filtered_old=d.get("filtered_old", 0),
+            filtered_resolved=d.get("filtered_resolved", 0),
+            filtered_noise=d.get("filtered_noise", 0),
+            duplicate=d.get("duplicate", 0),
+            filtered=d.get("filtered", 0),
+            llm_failed=d.get("llm_failed", 0),
+            llm_skipped=d.get("llm_skipped", 0),
+            suppressed_limit=d.get("suppressed_limit", 0),
+            weekly_total=weekly.get("total", 0),
+            weekly_sent=weekly.get("sent", 0),
+            subscribers=subscribers_count,
+        ),
         parse_mode="HTML"
     )
 
@@ -136,13 +168,11 @@ async def cmd_stats(message: Message):
 @router.message(Command("report_week"))
 async def cmd_report_week(message: Message):
     """Generate weekly report."""
-    if not is_admin(message):
-        await message.answer("❌ Команда недоступна.")
-        return
-    
-    async with get_session() as session:
-        signals = await SignalRepository.get_recent(session, days=7)
-        stats = await NewsRepository.get_stats(session, days=7)
+    signals, signals_count, stats = await asyncio.gather(
+        _read(SignalRepository.get_recent, days=7, limit=10),
+        _read(SignalRepository.count_recent, days=7),
+        _read(NewsRepository.get_stats, days=7),
+    )
     
     if not signals:
         await message.answer(
@@ -154,13 +184,13 @@ async def cmd_report_week(message: Message):
     
     signals_text = "\n".join([
         f"• [{s.event_type}] {s.region or 'N/A'} - ур.{s.urgency}"
-        for s in signals[:10]
+        for s in signals
     ])
     
     await message.answer(
         f"📈 <b>Недельный отчёт</b>\n\n"
         f"<b>Всего собрано:</b> {stats.get('total', 0)}\n"
-        f"<b>Отправлено сигналов:</b> {len(signals)}\n\n"
+        f"<b>Отправлено сигналов:</b> {signals_count}\n\n"
         f"<b>Последние сигналы:</b>\n{signals_text}",
         parse_mode="HTML"
     )
@@ -169,64 +199,18 @@ async def cmd_report_week(message: Message):
 @router.message(Command("sources_list"))
 async def cmd_sources_list(message: Message):
     """List configured sources."""
-    if not is_admin(message):
-        await message.answer("❌ Команда недоступна.")
-        return
-    
-    config = get_config()
-    sources = config.sources
-    
-    # Group by type
-    rss_count = len([s for s in sources if s.type == "rss"])
-    web_count = len([s for s in sources if s.type == "web"])
-    gnews_count = len([s for s in sources if s.type == "google_news_rss"])
-    
-    # Sample sources
-    sample = "\n".join([f"• {s.name}" for s in sources[:10]])
-    
-    await message.answer(
-        f"📡 <b>Источники ({len(sources)})</b>\n\n"
-        f"RSS: {rss_count}\n"
-        f"Web: {web_count}\n"
-        f"Google News: {gnews_count}\n\n"
-        f"<b>Примеры:</b>\n{sample}\n"
-        f"... и ещё {max(0, len(sources) - 10)}",
-        parse_mode="HTML"
-    )
+    await message.answer(get_config_loader().sources_summary, parse_mode="HTML")
 
 
 @router.message(Command("config_show"))
 async def cmd_config_show(message: Message):
     """Show current config (without secrets)."""
-    if not is_admin(message):
-        await message.answer("❌ Команда недоступна.")
-        return
-    
-    config = get_config()
-    
-    await message.answer(
-        f"⚙️ <b>Конфигурация</b>\n\n"
-        f"<b>Пороги:</b>\n"
-        f"• filter1_to_llm: {config.thresholds.filter1_to_llm}\n"
-        f"• llm_relevance: {config.thresholds.llm_relevance}\n"
-        f"• llm_urgency: {config.thresholds.llm_urgency}\n\n"
-        f"<b>Лимиты:</b>\n"
-        f"• max_signals_per_day: {config.limits.max_signals_per_day}\n\n"
-        f"<b>Дедупликация:</b>\n"
-        f"• simhash_threshold: {config.dedup.simhash_threshold}\n\n"
-        f"<b>Расписание:</b>\n"
-        f"• check_interval: {config.schedule.check_interval_minutes} мин",
-        parse_mode="HTML"
-    )
+    await message.answer(get_config_loader().config_summary, parse_mode="HTML")
 
 
 @router.message(Command("config_set"))
 async def cmd_config_set(message: Message):
     """Set config value."""
-    if not is_admin(message):
-        await message.answer("❌ Команда недоступна.")
-        return
-    
     # Parse: /config_set path value
     parts = message.text.split(maxsplit=2)
     if len(parts) < 3:
@@ -241,19 +225,10 @@ async def cmd_config_set(message: Message):
     value = parts[2]
     
     # Validate key format
-    allowed_keys = [
-        "thresholds.filter1_to_llm",
-        "thresholds.llm_relevance",
-        "thresholds.llm_urgency",
-        "limits.max_signals_per_day",
-        "dedup.simhash_threshold",
-        "schedule.check_interval_minutes",
-    ]
-    
-    if key not in allowed_keys:
+    if key not in CONFIG_SET_KEYS:
         await message.answer(
             f"❌ Недопустимый ключ: {key}\n\n"
-            f"Допустимые ключи:\n" + "\n".join(f"• {k}" for k in allowed_keys),
+            f"Допустимые ключи:\n" + "\n".join(f"• {k}" for k in CONFIG_SET_KEYS_ORDERED),
             parse_mode="HTML"
         )
         return
@@ -279,19 +254,17 @@ async def cmd_config_set(message: Message):
 @router.message(Command("reload_config"))
 async def cmd_reload_config(message: Message):
     """Reload config from YAML + DB."""
-    if not is_admin(message):
-        await message.answer("❌ Команда недоступна.")
-        return
-    
     loader = get_config_loader()
     
     # Load DB overrides
     async with get_session() as session:
         overrides = await ConfigRepository.get_all(session)
     
-    # Reload
-    loader.reload()
+    # Reload (forced: start from the YAML values, then apply the DB overrides)
+    loader.reload(force=True)
     loader.set_overrides(overrides)
+    get_settings.cache_clear()
+    _admin_chat_id.cache_clear()
     
     logger.info("config_reloaded", overrides_count=len(overrides))
     
@@ -305,12 +278,9 @@ async def cmd_reload_config(message: Message):
 @router.message(Command("broadcast"))
 async def cmd_broadcast(message: Message):
     """Broadcast message to all subscribers."""
-    if not is_admin(message):
-        await message.answer("❌ Команда недоступна.")
-        return
-    
     # Parse: /broadcast <text>
-    text = message.text.replace("/broadcast", "", 1).strip()
+    parts = message.text.split(maxsplit=1)
+    text = parts[1].strip() if len(parts) > 1 else ""
     if not text:
         await message.answer(
             "📢 Использование: /broadcast <текст сообщения>",
@@ -333,10 +303,6 @@ async def cmd_broadcast(message: Message):
 @router.message(Command("broadcast_confirm"))
 async def cmd_broadcast_confirm(message: Message):
     """Confirm and execute broadcast."""
-    if not is_admin(message):
-        await message.answer("❌ Команда недоступна.")
-        return
-    
     await message.answer(
         "📢 Для рассылки используйте модуль broadcaster напрямую.\n"
         "Эта функция требует явного текста.",
@@ -347,39 +313,37 @@ async def cmd_broadcast_confirm(message: Message):
 @router.message(Command("health"))
 async def cmd_health(message: Message):
     """Show system health status (admin only)."""
-    if not is_admin(message):
-        await message.answer("❌ Команда недоступна.")
-        return
-    
-    from llm_monitor import CircuitBreaker, LLMUsageRepository
+    from llm_monitor import CircuitBreaker, UsageStatsCache
     
     checks = []
+    stats = []
     
-    # DB check
-    try:
-        async with get_session() as session:
-            await SubscriberRepository.count_active(session)
-        checks.append("✅ БД: ONLINE")
-    except Exception as e:
-        checks.append(f"❌ БД: ERROR ({str(e)[:20]})")
+    # DB check and stats share one session/connection
+    async with get_session() as session:
+        try:
+            # Liveness probe doubles as the subscriber count
+            subs = await SubscriberRepository.count_active(session)
+            checks.append("✅ БД: ONLINE")
+        except Exception as e:
+            checks.append(f"❌ БД: ERROR ({str(e)[:20]})")
+        else:
+            signals_today = await SignalRepository.count_today(session)
+            daily_cost = await UsageStatsCache.get_daily_cost(session)
+            errors_5m = await UsageStatsCache.get_recent_errors(session, minutes=5)
+            stats = [
+                f"👥 Подписчиков: {subs}",
+                f"📨 Сигналов: {signals_today}",
+                f"💰 Расход сегодня: ${daily_cost:.4f}",
+                f"❗ Ошибок (5мин): {errors_5m}",
+            ]
     
     # Circuit Breaker
     if CircuitBreaker.is_open():
         checks.append("❌ LLM Circuit: OPEN (Broken)")
     else:
         checks.append("✅ LLM Circuit: CLOSED (OK)")
-        
-    # Stats
-    async with get_session() as session:
-        subs = await SubscriberRepository.count_active(session)
-        signals_today = await SignalRepository.count_today(session)
-        daily_cost = await LLMUsageRepository.get_daily_cost(session)
-        errors_5m = await LLMUsageRepository.get_recent_errors(session, minutes=5)
     
-    checks.append(f"👥 Подписчиков: {subs}")
-    checks.append(f"📨 Сигналов: {signals_today}")
-    checks.append(f"💰 Расход сегодня: ${daily_cost:.4f}")
-    checks.append(f"❗ Ошибок (5мин): {errors_5m}")
+    checks.extend(stats)
     
     await message.answer(
         "🏥 <b>Статус системы (v1.7.0)</b>\n\n" + "\n".join(checks),
@@ -390,14 +354,11 @@ async def cmd_health(message: Message):
 @router.message(Command("guardrails"))
 async def cmd_guardrails(message: Message):
     """Show strict guardrails stats."""
-    if not is_admin(message):
-        return
-
-    from llm_monitor import CircuitBreaker, LLMUsageRepository
+    from llm_monitor import CircuitBreaker, UsageStatsCache
     
     async with get_session() as session:
-        cost = await LLMUsageRepository.get_daily_cost(session)
-        errors = await LLMUsageRepository.get_recent_errors(session, minutes=60)
+        cost = await UsageStatsCache.get_daily_cost(session)
+        errors = await UsageStatsCache.get_recent_errors(session, minutes=60)
         
     status = "🔴 OPEN (STOPPED)" if CircuitBreaker.is_open() else "🟢 CLOSED (RUNNING)"
     
@@ -414,10 +375,6 @@ async def cmd_guardrails(message: Message):
 @router.message(Command("test_signal"))
 async def cmd_test_signal(message: Message):
     """Send test signal to admin only (not to subscribers)."""
-    if not is_admin(message):
-        await message.answer("❌ Команда недоступна.")
-        return
-    
     logger.info(
         "admin_action",
         action="test_signal",
@@ -441,43 +398,36 @@ async def cmd_test_signal(message: Message):
 @router.message(Command("src"))
 async def cmd_src_search(message: Message):
     """Search sources: /src <query>."""
-    if not is_admin(message):
-        return
-
-    query = message.text.replace("/src", "").strip().lower()
+    parts = message.text.split(maxsplit=1)
+    query = parts[1].strip().lower() if len(parts) > 1 else ""
     if not query:
         await message.answer("ℹ️ Использование: `/src <название>`")
         return
 
     # Find sources
-    config = get_config()
-    matches = [s for s in config.sources if query in s.name.lower()]
+    matches = get_config_loader().search_sources(query)
     
     if not matches:
         await message.answer(f"🔍 Источники по запросу '{query}' не найдены.")
         return
         
+    shown = matches[:5]
+    
     # Render mini-report
     text = f"🔍 <b>Результаты поиска:</b> '{query}'\nFound: {len(matches)}\n\n"
-    
-    # Generate generic buttons for results (max 5)
-    from ui_keyboards import cb, InlineKeyboardMarkup, InlineKeyboardButton
-    buttons = []
-    
-    for s in matches[:5]:
-        status = "🟢" if s.is_enabled else "🔴"
-        text += f"{status} <b>{s.name}</b> ({s.type})\n"
-        
-        # Toggle button
-        btn = InlineKeyboardButton(
-            text=f"Toggle {s.name[:10]}",
-            callback_data=cb("sources", "toggle", s.type, 0) # Page 0 context
-        )
-        buttons.append([btn])
-        
+    text += "".join(
+        f"{SOURCE_STATUS_ICON[getattr(s, 'is_enabled', True)]} <b>{s.name}</b> ({s.type})\n"
+        for s in shown
+    )
     if len(matches) > 5:
         text += f"\n<i>...и ещё {len(matches)-5}</i>"
-        
+    
+    # Toggle button per shown result (page 0 context) + close
+    from ui_keyboards import cb, InlineKeyboardMarkup, InlineKeyboardButton
+    buttons = [
+        [InlineKeyboardButton(text=f"Toggle {s.name[:10]}", callback_data=cb("sources", "toggle", s.type, 0))]
+        for s in shown
+    ]
     buttons.append([InlineKeyboardButton(text="❌ Закрыть", callback_data=cb("close"))])
     
     await message.answer(text, reply_markup=InlineKeyboardMarkup(inline_keyboard=buttons), parse_mode="HTML")
@@ -486,11 +436,6 @@ async def cmd_src_search(message: Message):
 @router.message(Command("config_export"))
 async def cmd_config_export(message: Message):
     """Export overrides as JSON."""
-    if not is_admin(message):
-        return
-
-    import json
-    from io import BytesIO
     from aiogram.types import BufferedInputFile
     
     async with get_session() as session:
@@ -500,8 +445,13 @@ async def cmd_config_export(message: Message):
         await message.answer("ℹ️ Нет активных overrides.")
         return
         
-    data = json.dumps(overrides, indent=2, ensure_ascii=False)
-    file = BufferedInputFile(data.encode("utf-8"), filename="config_overrides.json")
+    try:
+        import orjson
+        data = orjson.dumps(overrides, option=orjson.OPT_INDENT_2)
+    except ImportError:
+        import json
+        data = json.dumps(overrides, indent=2, ensure_ascii=False).encode("utf-8")
+    file = BufferedInputFile(data, filename="config_overrides.json")
     
     await message.answer_document(file, caption=f"📦 Config Export ({len(overrides)} items)")
 
@@ -509,9 +459,6 @@ async def cmd_config_export(message: Message):
 @router.message(Command("config_import"))
 async def cmd_config_import(message: Message):
     """Import overrides from JSON."""
-    if not is_admin(message):
-        return
-        
     # Check for document
     if not message.reply_to_message or not message.reply_to_message.document:
         await message.answer(
@@ -524,11 +471,48 @@ async def cmd_config_import(message: Message):
         await message.answer("❌ Файл должен быть .json")
         return
         
-    # Download logic (simplified mock, real bot needs bot.download)
-    # Since we can't easily download in this env without bot instance reference,
-    # we'll simulate the next step or guide the user.
-    # In a real scenario:
-    # file = await bot.download(doc)
-    # content = file.read()
-    
-    await message.answer("⚠️ Import functionality requires bot instance context (mocked).")
+    import json
+    
+    try:
+        file = await message.bot.download(doc)
+    except Exception as e:
+        logger.warning("config_import_download_failed", error=str(e))
+        await message.answer(f"❌ Не удалось скачать файл: {str(e)[:100]}")
+        return
+    
+    try:
+        data = json.loads(file.read().decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        await message.answer(f"❌ Некорректный JSON: {str(e)[:100]}")
+        return
+    
+    if not isinstance(data, dict) or not data:
+        await message.answer("❌ Ожидается непустой JSON-объект {key: value}.")
+        return
+    
+    # Same whitelist as /config_set; only scalar values
+    items = {
+        k: str(v) for k, v in data.items()
+        if k in CONFIG_SET_KEYS and isinstance(v, (str, int, float))
+    }
+    skipped = [str(k) for k in data if k not in items]
+    skipped_text = (
+        "\nПропущено (недопустимый ключ или значение):\n" + "\n".join(f"• {k}" for k in skipped)
+        if skipped else ""
+    )
+    
+    if not items:
+        await message.answer("❌ Нечего импортировать." + skipped_text)
+        return
+    
+    # Save all keys in one upsert
+    async with get_session() as session:
+        await ConfigRepository.set_many(session, items, message.chat.id)
+        await session.commit()
+        overrides = await ConfigRepository.get_all(session)
+    
+    get_config_loader().set_overrides(overrides)
+    
+    logger.info("config_imported", count=len(items), skipped=len(skipped), by=message.chat.id)
+    
+    await message.answer(f"✅ Импортировано {len(items)} override(s)." + skipped_text)
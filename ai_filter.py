@@ -1,129 +1,43 @@
+import asyncio
+import bisect
+import hashlib
 import json
 import logging
-from typing import Optional, List, Dict
+import re
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime
-from openai import OpenAI
+import httpx
+from openai import OpenAI, AsyncOpenAI, BadRequestError
 from models import NewsArticle, FilteredEvent
 from config import config
 from database import db
+from llm_cache import SemanticCache
+from local_classifier import LocalClassifier
 
 logger = logging.getLogger(__name__)
 
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+    logger.warning("pyahocorasick not installed: keyword scoring uses per-keyword scans")
 
-class AIFilter:
-    def __init__(self):
-        self.client = OpenAI(api_key=config.PERPLEXITY_API_KEY, base_url=config.PERPLEXITY_API_BASE)
-        self.model = config.PERPLEXITY_MODEL
-        self.threshold = config.LLM_RELEVANCE_THRESHOLD
-        
-        # Stage 2 Configs
-        self.positive_keywords = config.KEYWORDS_POSITIVE
-        self.negative_keywords = config.KEYWORDS_NEGATIVE
-        self.weights = config.SCORE_WEIGHTS
-        self.score_threshold = config.KEYWORD_SCORE_THRESHOLD
-    
-    def filter_article(self, article: NewsArticle) -> Optional[FilteredEvent]:
-        try:
-            # 1. Pre-filtering (Weighted Scoring)
-            keyword_score = self._calculate_keyword_score(article.title + " " + article.content)
-            
-            if keyword_score < self.score_threshold:
-                # logger.debug(f"Skipping {article.title[:30]}... (Score: {keyword_score})")
-                return None
-                
-            logger.info(f"🔎 Analyzing (Score {keyword_score}): {article.title[:50]}...")
-
-            # 2. LLM Analysis
-            prompt = self._create_analysis_prompt(article)
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "Ты аналитик инцидентов ЖКХ. Твоя задача — классифицировать события и возвращать JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=500
-            )
-            
-            result = self._parse_ai_response(response)
-            
-            if not result:
-                logger.warning(f"Failed to parse AI response for: {article.title}")
-                return None
-            
-            # 3. Post-processing & Validation
-            relevance = result.get('relevance', 0.0)
-            urgency = result.get('urgency', 1)
-            
-            if relevance < self.threshold:
-                logger.info(f"  💤 REJECTED (Relevance {relevance:.2f} < {self.threshold})")
-                return None
-                
-            logger.info(f"  ✅ ACCEPTED (Relevance {relevance:.2f} | Urgency {urgency})")
-            
-            event = FilteredEvent(
-                article_id=article.id,
-                title=article.title,
-                url=article.url,
-                relevance_score=relevance,
-                category=result.get('event_type', 'other'),
-                urgency=urgency,
-                object=result.get('object', 'unknown'),
-                why=result.get('why', 'No explanation'),
-                action=result.get('action', 'ignore'),
-                filtered_at=datetime.now()
-            )
-            
-            # Save raw 'why' as reasoning for backward compatibility if needed, or just use 'why'
-            event.reasoning = f"{event.why} (Action: {event.action})"
-            
-            event_dict = event.model_dump()
-            event_dict['filtered_at'] = event_dict['filtered_at'].isoformat()
-            db.save_filtered_event(event_dict)
-            
-            return event
-            
-        except Exception as e:
-            logger.error(f"Error filtering article {article.title}: {e}")
-            return None
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
 
-    def _calculate_keyword_score(self, text: str) -> int:
-        score = 0
-        text_lower = text.lower()
-        
-        # Positive weights
-        for word in self.positive_keywords:
-            if word in text_lower:
-                # Basic logic: if keyword found, add points based on category
-                # For simplicity, we'll try to map keywords to categories or just use a default positive weight
-                if word in ["авария", "прорыв", "остановка"]:
-                    score += self.weights.get("accident", 3)
-                elif word in ["ремонт", "замена"]:
-                    score += self.weights.get("repair", 2)
-                elif word in ["водоканал", "котельная", "насосная"]:
-                    score += self.weights.get("infra", 4)
-                elif word in ["цех", "агрегат"]:
-                    score += self.weights.get("industry", 2)
-                else:
-                    score += 1 # Default positive
-        
-        # Negative weights
-        for word in self.negative_keywords:
-            if word in text_lower:
-                score += self.weights.get("negative", -5)
-        
-        return score
-    
-    def _create_analysis_prompt(self, article: NewsArticle) -> str:
-        return f"""
-Проанализируй новость и классифицируй её для системы мониторинга инцидентов ЖКХ.
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
 
-ВХОДНЫЕ ДАННЫЕ:
-Заголовок: {article.title}
-Источник: {article.source}
-Текст: {article.content[:2000]}
+SYSTEM_PROMPT = "Ты аналитик инцидентов ЖКХ. Твоя задача — классифицировать события и возвращать JSON."
 
-ПРАВИЛА:
+ANALYSIS_RULES = """ПРАВИЛА:
 1. Тип события (event_type):
    - accident: авария, прорыв, утечка, поломка, остановка, выход из строя
    - outage: отключение света/воды/тепла (без явной аварии)
@@ -149,41 +63,641 @@ class AIFilter:
 5. Действие (action):
    - call: Если relevance >= 0.6 И urgency >= 3
    - watch: Если relevance >= 0.6 И urgency < 3
-   - ignore: Иначе
+   - ignore: Иначе"""
 
-ФОРМАТ ОТВЕТА (JSON):
-{{
+RESPONSE_OBJECT = """{
   "event_type": "accident|outage|repair|other",
   "relevance": float,
   "urgency": int,
   "object": "water|heat|industrial|unknown",
   "why": "Одна фраза - причина важности",
   "action": "call|watch|ignore"
-}}
+}"""
+
+# Instructions first, article data last: the prompt prefix is byte-identical
+# across requests, so providers with prefix caching reuse it
+ANALYSIS_PROMPT_PREFIX = f"""
+Проанализируй новость и классифицируй её для системы мониторинга инцидентов ЖКХ.
+
+{ANALYSIS_RULES}
+
+ФОРМАТ ОТВЕТА (JSON):
+{RESPONSE_OBJECT}
+
+ВХОДНЫЕ ДАННЫЕ:
 """
-    
-    def _parse_ai_response(self, response) -> Optional[Dict]:
+
+BATCH_PROMPT_PREFIX = f"""
+Проанализируй каждую новость из входного JSON-массива и классифицируй их для системы мониторинга инцидентов ЖКХ.
+
+{ANALYSIS_RULES}
+
+ФОРМАТ ОТВЕТА (JSON):
+Объект {{"results": [...]}}, где results — массив из стольких же объектов, сколько входных новостей, в том же порядке, каждый вида:
+{RESPONSE_OBJECT}
+
+ВХОДНЫЕ ДАННЫЕ (JSON-массив):
+"""
+
+
+def build_analysis_prompt(article: NewsArticle) -> str:
+    return ANALYSIS_PROMPT_PREFIX + f"""Заголовок: {article.title}
+Источник: {article.source}
+Текст: {article.content[:2000]}
+"""
+
+
+def build_batch_prompt(articles: List[NewsArticle]) -> str:
+    items = json.dumps(
+        [
+            {"id": i, "title": a.title, "source": a.source, "content": a.content[:1500]}
+            for i, a in enumerate(articles)
+        ],
+        ensure_ascii=False, indent=1
+    )
+    return BATCH_PROMPT_PREFIX + f"""Новостей: {len(articles)}
+{items}
+"""
+
+
+# Articles per multi-item LLM request and completion budget per article
+BATCH_SIZE = 10
+MAX_TOKENS_PER_ITEM = 120
+# Snippet length bin edges (chars): batches only mix articles of similar size
+LENGTH_BINS = (500, 1200)
+
+# One keep-alive pool per client for the whole process
+HTTP_TIMEOUT = 30
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+_JSON_FENCE = re.compile(r'```(?:json)?\s*([\[{].*?[\]}])\s*```', re.DOTALL)
+_JSON_START = re.compile(r'[\[{]')
+_JSON_DECODER = json.JSONDecoder()
+
+
+class AIFilter:
+    def __init__(self):
+        self.client = OpenAI(
+            api_key=config.PERPLEXITY_API_KEY,
+            base_url=config.PERPLEXITY_API_BASE,
+            http_client=httpx.Client(http2=HAS_HTTP2, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+        )
+        self.async_client = AsyncOpenAI(
+            api_key=config.PERPLEXITY_API_KEY,
+            base_url=config.PERPLEXITY_API_BASE,
+            http_client=httpx.AsyncClient(http2=HAS_HTTP2, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+        )
+        self.model = config.PERPLEXITY_MODEL
+        self.threshold = config.LLM_RELEVANCE_THRESHOLD
+        # Cascade: the small model classifies first, the large one only gets
+        # unparsable or borderline results
+        self.model_small = config.PERPLEXITY_MODEL_SMALL
+        self.escalation_margin = config.LLM_ESCALATION_MARGIN
+        self.cascade_total = 0
+        self.cascade_escalated = 0
+
+        # Stage 2 Configs
+        self.positive_keywords = config.KEYWORDS_POSITIVE
+        self.negative_keywords = config.KEYWORDS_NEGATIVE
+        self.weights = config.SCORE_WEIGHTS
+        self.score_threshold = config.KEYWORD_SCORE_THRESHOLD
+        # Keyword -> score weight, matched in a single pass over the text
+        self._keyword_weights = self._build_keyword_weights()
+        self._keyword_list = list(self._keyword_weights)
+        self._keyword_hs = self._build_keyword_hyperscan()
+        self._keyword_automaton = None if self._keyword_hs else self._build_keyword_automaton()
+
+        # Clear negatives are rejected locally, without an LLM call
+        self.local_classifier = LocalClassifier()
+        self.local_reject_below = config.LOCAL_CLASSIFIER_REJECT_BELOW
+
+        # Near-duplicate articles reuse earlier LLM classifications
+        self.cache = SemanticCache()
+        # Byte-identical requests are served from the exact-match cache
+        self.temperature = 0.1
+        self.request_cache_enabled = config.LLM_CACHE_ENABLED
+        self.request_cache_ttl = config.LLM_CACHE_TTL_HOURS * 3600
+        # Plain-JSON streamed responses instead of fenced markdown
+        self.json_mode = config.LLM_JSON_MODE
+
+    async def aclose(self):
+        """Close both clients' pooled HTTP connections (call once at shutdown)."""
+        await self.async_client.close()
+        self.client.close()
+
+    def filter_article(self, article: NewsArticle) -> Optional[FilteredEvent]:
+        return self.filter_articles_batch([article])[0]
+
+    def filter_articles_batch(self, articles: List[NewsArticle]) -> List[Optional[FilteredEvent]]:
+        """Filter articles, classifying cache misses BATCH_SIZE at a time in one LLM call.
+
+        Returns one entry per input article (None if rejected or failed).
+        """
+        events, pending = self._prefilter(articles)
+
+        for chunk in self._pack_batches(pending):
+            try:
+                results, models = self._classify([article for _, article, _ in chunk])
+            except Exception as e:
+                logger.error(f"Error classifying batch of {len(chunk)}: {e}")
+                continue
+            self._finish_chunk(chunk, results, models, events)
+
+        return events
+
+    async def filter_article_async(self, article: NewsArticle) -> Optional[FilteredEvent]:
+        return (await self.filter_many([article]))[0]
+
+    async def filter_many(
+        self,
+        articles: List[NewsArticle],
+        concurrency: int = 16
+    ) -> List[Optional[FilteredEvent]]:
+        """Async filter_articles_batch: LLM batches run concurrently, at most
+        `concurrency` requests in flight. Each article is marked processed in the
+        DB as soon as it is done, so a restart resumes with the remaining ones.
+
+        Blocking work (classifier, embeddings, SQLite) runs in worker threads so
+        the event loop keeps serving in-flight requests and the bot meanwhile.
+        """
+        events, pending = await asyncio.to_thread(self._prefilter_and_mark, articles)
+        semaphore = asyncio.Semaphore(concurrency)
+        # One chunk is stored at a time: SQLite has a single writer and the
+        # semantic cache is not thread-safe
+        finish_lock = asyncio.Lock()
+
+        def finish(chunk, results, models):
+            self._finish_chunk(chunk, results, models, events)
+            db.mark_articles_processed(article.id for _, article, _ in chunk)
+
+        async def run_chunk(chunk):
+            try:
+                async with semaphore:
+                    results, models = await self._classify_async([article for _, article, _ in chunk])
+            except Exception as e:
+                logger.error(f"Error classifying batch of {len(chunk)}: {e}")
+                return
+            async with finish_lock:
+                await asyncio.to_thread(finish, chunk, results, models)
+
+        await asyncio.gather(*[run_chunk(chunk) for chunk in self._pack_batches(pending)])
+        return events
+
+    def _prefilter_and_mark(self, articles: List[NewsArticle]) -> tuple:
+        """_prefilter, then mark the articles settled without an LLM call as processed."""
+        events, pending = self._prefilter(articles)
+        pending_ids = {article.id for _, article, _ in pending}
+        db.mark_articles_processed(article.id for article in articles if article.id not in pending_ids)
+        return events, pending
+
+    def _prefilter(self, articles: List[NewsArticle]) -> tuple:
+        """Keyword pre-filter + cache lookups.
+
+        Returns (events, pending): events has one slot per article, filled for
+        cache hits; pending lists (index, article, cache keys) needing the LLM.
+        """
+        events: List[Optional[FilteredEvent]] = [None] * len(articles)
+        pending: List[Tuple[int, NewsArticle, tuple]] = []
+        candidates: List[Tuple[int, NewsArticle, str]] = []
+
+        for i, article in enumerate(articles):
+            try:
+                # 1. Pre-filtering (Weighted Scoring)
+                keyword_score = self._calculate_keyword_score(article.title + " " + article.content)
+
+                if keyword_score < self.score_threshold:
+                    # logger.debug(f"Skipping {article.title[:30]}... (Score: {keyword_score})")
+                    continue
+
+                # Title + content head, shared by the local classifier and the caches
+                snippet = article.title + " " + article.content[:1500]
+
+                relevance = self.local_classifier.predict(snippet)
+                if relevance is not None and relevance < self.local_reject_below:
+                    logger.info(f"  💤 REJECTED locally (p={relevance:.2f}): {article.title[:50]}...")
+                    continue
+
+                logger.info(f"🔎 Analyzing (Score {keyword_score}): {article.title[:50]}...")
+                candidates.append((i, article, snippet))
+            except Exception as e:
+                logger.error(f"Error filtering article {article.title}: {e}")
+
+        # One encoder call for all candidates; each embedding then serves
+        # both the cache lookup and the cache store
+        # (all None if the encoder fails: exact cache and LLM still work)
+        embeddings = self.cache.embed_many([snippet for _, _, snippet in candidates])
+        filtered_at = datetime.now()
+        verdicts = []
+
+        for (i, article, snippet), embedding in zip(candidates, embeddings):
+            try:
+                # 2. LLM Analysis - caches first
+                keys = self._cache_keys(article, snippet, embedding)
+                result = self._cache_get(keys)
+                if result is not None:
+                    verdicts.append((result['relevance'], article.id))
+                    events[i] = self._handle_result(article, result, filtered_at)
+                else:
+                    pending.append((i, article, keys))
+            except Exception as e:
+                logger.error(f"Error filtering article {article.title}: {e}")
+
+        self._store_verdicts(verdicts)
+        return events, pending
+
+    @staticmethod
+    def _pack_batches(pending: list) -> List[list]:
+        """Split pending items into LLM batches of at most BATCH_SIZE, one length bin at a time."""
+        bins = [[] for _ in range(len(LENGTH_BINS) + 1)]
+        for item in pending:
+            snippet = item[2][1]
+            bins[bisect.bisect_right(LENGTH_BINS, len(snippet))].append(item)
+        return [
+            items[start:start + BATCH_SIZE]
+            for items in bins
+            for start in range(0, len(items), BATCH_SIZE)
+        ]
+
+    def _finish_chunk(self, chunk: list, results: List[Optional[Dict]], models: List[str], events: list):
+        # One timestamp for everything classified by the same response
+        filtered_at = datetime.now()
+        verdicts = []
+        for (i, article, keys), result, model in zip(chunk, results, models):
+            if not result:
+                logger.warning(f"Failed to parse AI response for: {article.title}")
+                continue
+            try:
+                verdicts.append((result['relevance'], article.id))
+                self._cache_set(keys, result, model)
+                events[i] = self._handle_result(article, result, filtered_at)
+            except Exception as e:
+                logger.error(f"Error filtering article {article.title}: {e}")
+        self._store_verdicts(verdicts)
+
+    @staticmethod
+    def _store_verdicts(verdicts: List[Tuple[float, str]]):
+        """Training labels for the local classifier (see local_classifier.export_training_data)."""
+        try:
+            db.set_llm_relevance(verdicts)
+        except Exception as e:
+            logger.error(f"Error storing {len(verdicts)} LLM verdicts: {e}")
+
+    def _handle_result(self, article: NewsArticle, result: Dict, filtered_at: datetime) -> Optional[FilteredEvent]:
+        # 3. Post-processing & Validation
+        relevance = result.get('relevance', 0.0)
+        urgency = result.get('urgency', 1)
+
+        if relevance < self.threshold:
+            logger.info(f"  💤 REJECTED (Relevance {relevance:.2f} < {self.threshold})")
+            return None
+
+        logger.info(f"  ✅ ACCEPTED (Relevance {relevance:.2f} | Urgency {urgency})")
+
+        event = FilteredEvent(
+            article_id=article.id,
+            title=article.title,
+            url=article.url,
+            relevance_score=relevance,
+            category=result.get('event_type', 'other'),
+            urgency=urgency,
+            object=result.get('object', 'unknown'),
+            why=result.get('why', 'No explanation'),
+            action=result.get('action', 'ignore'),
+            filtered_at=filtered_at
+        )
+
+        # Save raw 'why' as reasoning for backward compatibility if needed, or just use 'why'
+        event.reasoning = f"{event.why} (Action: {event.action})"
+
+        db.save_filtered_event(event.model_dump(mode='json'))
+
+        return event
+
+    def _build_messages(self, article: NewsArticle) -> List[Dict]:
+        return [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": build_analysis_prompt(article)}
+        ]
+
+    def _request_cache_key(self, messages: List[Dict], model: str) -> str:
+        payload = json.dumps(
+            {"model": model, "messages": messages, "temperature": self.temperature},
+            sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _cache_keys(self, article: NewsArticle, snippet: str, embedding) -> tuple:
+        """(request_keys, cache_text, embedding) for an article, computed once.
+
+        request_keys maps each configured model (large first) to the key its
+        answer to this article is cached under.
+        """
+        request_keys = {}
+        if self.request_cache_enabled:
+            messages = self._build_messages(article)
+            for model in (self.model, self.model_small):
+                if model:
+                    request_keys[model] = self._request_cache_key(messages, model)
+        return request_keys, snippet, embedding
+
+    def _cache_get(self, keys: tuple) -> Optional[Dict]:
+        request_keys, cache_text, embedding = keys
+
+        # Exact request match (same model, prompt and temperature); a small-model
+        # answer is only cached if it didn't need escalation
+        for request_key in request_keys.values():
+            cached = db.get_llm_cache(request_key)
+            if cached is not None:
+                logger.info("  ♻️ Cached response reused")
+                return json.loads(cached)
+
+        # Near-duplicate article (not copied into the request cache: no model answered this request)
+        result = self.cache.get(cache_text, embedding)
+        if result is not None:
+            logger.info("  ♻️ Cached classification reused")
+        return result
+
+    def _cache_set(self, keys: tuple, result: Dict, model: str):
+        """Cache result, as answered by model."""
+        request_keys, cache_text, embedding = keys
+        self.cache.set(cache_text, result, embedding)
+        request_key = request_keys.get(model)
+        if request_key:
+            db.set_llm_cache(request_key, json.dumps(result, ensure_ascii=False), self.request_cache_ttl)
+
+    def _batch_request(self, articles: List[NewsArticle], model: str) -> dict:
+        """chat.completions.create kwargs for classifying articles in one request."""
+        if len(articles) == 1:
+            request = dict(
+                model=model,
+                messages=self._build_messages(articles[0]),
+                temperature=self.temperature,
+                max_tokens=500
+            )
+        else:
+            request = dict(
+                model=model,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": build_batch_prompt(articles)}
+                ],
+                temperature=self.temperature,
+                max_tokens=MAX_TOKENS_PER_ITEM * len(articles)
+            )
+        if self.json_mode:
+            request.update(response_format={"type": "json_object"}, stream=True)
+        return request
+
+    def _without_json_mode(self, request: dict, error: Exception) -> dict:
+        """Plain version of a JSON-mode request the API rejected; JSON mode stays off afterwards."""
+        if self.json_mode:
+            logger.warning(f"JSON mode rejected by the API, disabling it: {error}")
+            self.json_mode = False
+        return {k: v for k, v in request.items() if k not in ("response_format", "stream")}
+
+    def _complete(self, request: dict) -> str:
+        """Completion text; streamed requests are accumulated as chunks arrive."""
+        try:
+            response = self.client.chat.completions.create(**request)
+        except BadRequestError as e:
+            if "response_format" not in request:
+                raise
+            request = self._without_json_mode(request, e)
+            response = self.client.chat.completions.create(**request)
+        if not request.get("stream"):
+            return response.choices[0].message.content
+        return "".join(chunk.choices[0].delta.content or "" for chunk in response if chunk.choices)
+
+    async def _complete_async(self, request: dict) -> str:
+        try:
+            response = await self.async_client.chat.completions.create(**request)
+        except BadRequestError as e:
+            if "response_format" not in request:
+                raise
+            request = self._without_json_mode(request, e)
+            response = await self.async_client.chat.completions.create(**request)
+        if not request.get("stream"):
+            return response.choices[0].message.content
+        parts = []
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        return "".join(parts)
+
+    def _batch_results(self, articles: List[NewsArticle], content: str) -> Optional[List[Optional[Dict]]]:
+        """Parse a batch response; None means the batch must be retried per article."""
+        if len(articles) == 1:
+            return [self._parse_ai_response(content)]
+
+        results = self._parse_batch_response(content, len(articles))
+        if results is None:
+            logger.warning(f"Batch response unusable, retrying {len(articles)} articles one by one")
+        return results
+
+    def _needs_escalation(self, result: Optional[Dict]) -> bool:
+        """Small-model result too uncertain to keep."""
+        if not result:
+            return True
+        return abs(result['relevance'] - self.threshold) < self.escalation_margin or result.get('urgency') == 3
+
+    def _escalations(self, articles: List[NewsArticle], results: List[Optional[Dict]]) -> List[int]:
+        escalate = [i for i, result in enumerate(results) if self._needs_escalation(result)]
+        self.cascade_total += len(articles)
+        self.cascade_escalated += len(escalate)
+        if escalate:
+            logger.info(
+                f"  ⬆️ Escalating {len(escalate)}/{len(articles)} to {self.model} "
+                f"(escalation rate {self.cascade_escalated / self.cascade_total:.0%})"
+            )
+        return escalate
+
+    def _classify(self, articles: List[NewsArticle]) -> Tuple[List[Optional[Dict]], List[str]]:
+        """Classify with the small model, re-running uncertain items on the large one.
+
+        Returns (results, models): one result and the model that produced it per article.
+        """
+        if not self.model_small:
+            return self._classify_batch(articles, self.model), [self.model] * len(articles)
+
         try:
-            content = response.choices[0].message.content.strip()
-            # Clean markdown
-            if '```json' in content:
-                content = content.split('```json')[1].split('```')[0].strip()
-            elif '```' in content:
-                content = content.split('```')[1].split('```')[0].strip()
-                
-            result = json.loads(content)
-            
-            # Validate essential fields
-            required = ['event_type', 'relevance', 'urgency']
-            if not all(k in result for k in required):
-                logger.warning(f"AI response missing fields: {result.keys()}")
-                return None
-                
-            result['relevance'] = float(result['relevance'])
-            return result
+            results = self._classify_batch(articles, self.model_small)
+        except Exception as e:
+            logger.warning(f"Small model failed, escalating batch of {len(articles)}: {e}")
+            results = [None] * len(articles)
+
+        models = [self.model_small] * len(articles)
+        escalate = self._escalations(articles, results)
+        if escalate:
+            large = self._classify_batch([articles[i] for i in escalate], self.model)
+            for i, result in zip(escalate, large):
+                results[i] = result
+                models[i] = self.model
+        return results, models
+
+    async def _classify_async(self, articles: List[NewsArticle]) -> Tuple[List[Optional[Dict]], List[str]]:
+        if not self.model_small:
+            return await self._classify_batch_async(articles, self.model), [self.model] * len(articles)
+
+        try:
+            results = await self._classify_batch_async(articles, self.model_small)
+        except Exception as e:
+            logger.warning(f"Small model failed, escalating batch of {len(articles)}: {e}")
+            results = [None] * len(articles)
+
+        models = [self.model_small] * len(articles)
+        escalate = self._escalations(articles, results)
+        if escalate:
+            large = await self._classify_batch_async([articles[i] for i in escalate], self.model)
+            for i, result in zip(escalate, large):
+                results[i] = result
+                models[i] = self.model
+        return results, models
+
+    def _classify_batch(self, articles: List[NewsArticle], model: str) -> List[Optional[Dict]]:
+        """Classify articles with one LLM request; one result (or None) per article."""
+        content = self._complete(self._batch_request(articles, model))
+        results = self._batch_results(articles, content)
+        if results is None:
+            return [self._classify_batch([article], model)[0] for article in articles]
+        return results
+
+    async def _classify_batch_async(self, articles: List[NewsArticle], model: str) -> List[Optional[Dict]]:
+        content = await self._complete_async(self._batch_request(articles, model))
+        results = self._batch_results(articles, content)
+        if results is None:
+            singles = await asyncio.gather(*[self._classify_batch_async([a], model) for a in articles])
+            return [r[0] for r in singles]
+        return results
+
+    def _build_keyword_weights(self) -> Dict[str, int]:
+        """Score contribution of each keyword (positive and negative lists combined).
+
+        Keys are lowercased here, once, since they are matched against the
+        lowercased article text.
+        """
+        weights: Dict[str, int] = {}
+        for word in map(str.lower, self.positive_keywords):
+            # Basic logic: if keyword found, add points based on category
+            # For simplicity, we'll try to map keywords to categories or just use a default positive weight
+            if word in ["авария", "прорыв", "остановка"]:
+                weight = self.weights.get("accident", 3)
+            elif word in ["ремонт", "замена"]:
+                weight = self.weights.get("repair", 2)
+            elif word in ["водоканал", "котельная", "насосная"]:
+                weight = self.weights.get("infra", 4)
+            elif word in ["цех", "агрегат"]:
+                weight = self.weights.get("industry", 2)
+            else:
+                weight = 1 # Default positive
+            weights[word] = weights.get(word, 0) + weight
+
+        for word in map(str.lower, self.negative_keywords):
+            weights[word] = weights.get(word, 0) + self.weights.get("negative", -5)
+
+        return weights
+
+    def _build_keyword_hyperscan(self):
+        """Hyperscan database of all keywords (SIMD scan, no lower() needed)."""
+        if not HAS_HYPERSCAN:
+            return None
+        flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8
+                 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH)
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[re.escape(word).encode("utf-8") for word in self._keyword_list],
+                ids=list(range(len(self._keyword_list))),
+                flags=[flags] * len(self._keyword_list),
+            )
+            return database
+        except Exception as e:
+            logger.warning(f"Hyperscan keyword database not available: {e}")
+            return None
+
+    def _build_keyword_automaton(self):
+        if not HAS_AHOCORASICK:
+            return None
+        automaton = ahocorasick.Automaton()
+        for word in self._keyword_weights:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return automaton
+
+    def _calculate_keyword_score(self, text: str) -> int:
+        if self._keyword_hs is not None:
+            found_ids = set()
+
+            def on_match(keyword_id, start, end, flags, context):
+                found_ids.add(keyword_id)
+
+            self._keyword_hs.scan(text.encode("utf-8"), match_event_handler=on_match)
+            return sum(self._keyword_weights[self._keyword_list[i]] for i in found_ids)
+
+        text_lower = text.lower()
+
+        # Each keyword counts once, however often it occurs
+        if self._keyword_automaton is not None:
+            found = {word for _, word in self._keyword_automaton.iter(text_lower)}
+        else:
+            found = [word for word in self._keyword_weights if word in text_lower]
+
+        return sum(self._keyword_weights[word] for word in found)
+
+    def _response_json(self, content: str):
+        if self.json_mode:
+            try:
+                return json.loads(content)
+            except ValueError:
+                pass  # model ignored JSON mode, fall back to extraction
+
+        # JSON inside a markdown fence, else the first object/array in the text
+        match = _JSON_FENCE.search(content)
+        if match:
+            return json.loads(match.group(1))
+        start = _JSON_START.search(content)
+        if start is None:
+            raise ValueError("no JSON in AI response")
+        return _JSON_DECODER.raw_decode(content, start.start())[0]
+
+    def _validate_result(self, result) -> Optional[Dict]:
+        # Validate essential fields
+        required = ['event_type', 'relevance', 'urgency']
+        if not isinstance(result, dict) or not all(k in result for k in required):
+            logger.warning(f"AI response missing fields: {list(result.keys()) if isinstance(result, dict) else result}")
+            return None
+
+        result['relevance'] = float(result['relevance'])
+        return result
+
+    def _parse_ai_response(self, content: str) -> Optional[Dict]:
+        try:
+            return self._validate_result(self._response_json(content))
         except Exception as e:
             logger.error(f"Error parsing AI response: {e}")
             return None
 
+    def _parse_batch_response(self, content: str, expected: int) -> Optional[List[Optional[Dict]]]:
+        try:
+            results = self._response_json(content)
+        except Exception as e:
+            logger.error(f"Error parsing AI batch response: {e}")
+            return None
+
+        if isinstance(results, dict):
+            results = results.get("results")
+
+        if not isinstance(results, list) or len(results) != expected:
+            logger.warning(f"AI batch response has wrong shape (expected {expected} items)")
+            return None
+
+        parsed = []
+        for item in results:
+            try:
+                parsed.append(self._validate_result(item))
+            except Exception as e:
+                logger.error(f"Error parsing AI response: {e}")
+                parsed.append(None)
+        return parsed
+
 
 ai_filter = AIFilter()
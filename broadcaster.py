@@ -4,11 +4,50 @@ from typing import List, Optional
 from aiogram import Bot
 from aiogram.exceptions import TelegramForbiddenError, TelegramBadRequest, TelegramRetryAfter
 
-from db_pkg import get_session, SubscriberRepository, Subscriber
+from db_pkg import get_session, SubscriberRepository
 from logging_setup import get_logger
 
 logger = get_logger("bot.broadcaster")
 
+# Per-recipient send outcomes
+SENT = "sent"
+FAILED = "failed"
+DEACTIVATE = "deactivate"
+
+
+class RateLimiter:
+    """Spaces out acquisitions to at most `rate` per second.
+    
+    Callers wait only for their own slot, so the sends themselves
+    (network round-trips) overlap instead of being serialized.
+    """
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait for the next free send slot (outside any flood-wait pause)."""
+        loop = asyncio.get_running_loop()
+        while True:
+            async with self._lock:
+                now = loop.time()
+                slot = max(now, self._next_slot)
+                self._next_slot = slot + self.interval
+            if slot > now:
+                await asyncio.sleep(slot - now)
+            # Slots reserved before a defer() fall inside the pause: take a new one
+            if loop.time() >= self._paused_until:
+                return
+    
+    def defer(self, seconds: float) -> None:
+        """Pause all sending for `seconds` (e.g. after a Telegram flood wait)."""
+        now = asyncio.get_running_loop().time()
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._next_slot = max(self._next_slot, self._paused_until)
+
 
 class Broadcaster:
     """Rate-limited message broadcaster for Telegram.
@@ -18,7 +57,7 @@ class Broadcaster:
     
     def __init__(self, bot: Bot, messages_per_second: float = 15):
         self.bot = bot
-        self.delay = 1.0 / messages_per_second  # Delay between messages
+        self.limiter = RateLimiter(messages_per_second)
     
     async def broadcast(
         self,
@@ -33,65 +72,30 @@ class Broadcaster:
             (sent_count, failed_count)
         """
         async with get_session() as session:
-            subscribers = await SubscriberRepository.get_active(session)
+            chat_ids = await SubscriberRepository.get_active_chat_ids(session)
         
-        if not subscribers:
+        if not chat_ids:
             logger.info("broadcast_no_subscribers")
             return 0, 0
         
-        sent = 0
-        failed = 0
-        deactivated = []
+        results = await asyncio.gather(*[
+            self._send_one(
+                chat_id,
+                text,
+                parse_mode=parse_mode,
+                disable_web_page_preview=disable_web_page_preview
+            )
+            for chat_id in chat_ids
+        ])
         
-        for subscriber in subscribers:
-            try:
-                await self.bot.send_message(
-                    chat_id=subscriber.chat_id,
-                    text=text,
-                    parse_mode=parse_mode,
-                    disable_web_page_preview=disable_web_page_preview
-                )
-                sent += 1
-                
-            except TelegramForbiddenError:
-                # Bot blocked by user
-                deactivated.append(subscriber.chat_id)
-                failed += 1
-                
-            except TelegramBadRequest as e:
-                # Chat not found or other issue
-                if "chat not found" in str(e).lower():
-                    deactivated.append(subscriber.chat_id)
-                failed += 1
-                logger.warning("broadcast_bad_request", chat_id=subscriber.chat_id, error=str(e))
-                
-            except TelegramRetryAfter as e:
-                # Flood control - wait and retry
-                logger.warning("broadcast_flood_wait", seconds=e.retry_after)
-                await asyncio.sleep(e.retry_after)
-                try:
-                    await self.bot.send_message(
-                        chat_id=subscriber.chat_id,
-                        text=text,
-                        parse_mode=parse_mode,
-                        disable_web_page_preview=disable_web_page_preview
-                    )
-                    sent += 1
-                except Exception:
-                    failed += 1
-                    
-            except Exception as e:
-                failed += 1
-                logger.error("broadcast_error", chat_id=subscriber.chat_id, error=str(e))
-            
-            # Rate limiting
-            await asyncio.sleep(self.delay)
+        sent = results.count(SENT)
+        failed = len(results) - sent
+        deactivated = [chat_id for chat_id, r in zip(chat_ids, results) if r == DEACTIVATE]
         
         # Deactivate blocked users
         if deactivated:
             async with get_session() as session:
-                for chat_id in deactivated:
-                    await SubscriberRepository.set_active(session, chat_id, False)
+                await SubscriberRepository.set_active_bulk(session, deactivated, False)
                 await session.commit()
             logger.info("broadcast_deactivated", count=len(deactivated))
         
@@ -124,9 +128,9 @@ class Broadcaster:
         exclude = set(exclude_chat_ids or [])
         
         async with get_session() as session:
-            subscribers = await SubscriberRepository.get_active(session)
+            chat_ids = await SubscriberRepository.get_active_chat_ids(session)
         
-        recipients = [s for s in subscribers if s.chat_id not in exclude]
+        recipients = [chat_id for chat_id in chat_ids if chat_id not in exclude]
         
         if not recipients:
             return 0
@@ -143,13 +147,13 @@ class Broadcaster:
     
     async def _send_to_list(
         self,
-        subscribers: List[Subscriber],
+        chat_ids: List[int],
         text: str,
         signal_id: Optional[int] = None,
         parse_mode: str = "HTML",
         disable_web_page_preview: bool = True
     ) -> tuple[int, int]:
-        """Send to specific list of subscribers."""
+        """Send to specific list of chat IDs."""
         from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
         from settings import get_settings
         
@@ -164,52 +168,83 @@ class Broadcaster:
                 InlineKeyboardButton(text="👎", callback_data=f"fb1:bad:{signal_id}")
             ]])
             
-        sent = 0
-        failed = 0
-        deactivated = []
+        results = await asyncio.gather(*[
+            self._send_one(
+                chat_id,
+                text,
+                parse_mode=parse_mode,
+                disable_web_page_preview=disable_web_page_preview,
+                # Attach keyboard only for admin
+                reply_markup=admin_kb if chat_id == admin_id else None
+            )
+            for chat_id in chat_ids
+        ])
+        
+        sent = results.count(SENT)
+        failed = len(results) - sent
+        deactivated = [chat_id for chat_id, r in zip(chat_ids, results) if r == DEACTIVATE]
+        
+        # Deactivate blocked users
+        if deactivated:
+            async with get_session() as session:
+                await SubscriberRepository.set_active_bulk(session, deactivated, False)
+                await session.commit()
+        
+        return sent, failed
+    
+    async def _send_one(
+        self,
+        chat_id: int,
+        text: str,
+        parse_mode: str = "HTML",
+        disable_web_page_preview: bool = True,
+        reply_markup=None
+    ) -> str:
+        """Send one message within the rate limit.
         
-        for subscriber in subscribers:
+        Returns SENT, FAILED or DEACTIVATE (chat blocked the bot / is gone).
+        """
+        await self.limiter.acquire()
+        try:
+            await self.bot.send_message(
+                chat_id=chat_id,
+                text=text,
+                parse_mode=parse_mode,
+                disable_web_page_preview=disable_web_page_preview,
+                reply_markup=reply_markup
+            )
+            return SENT
+            
+        except TelegramForbiddenError:
+            # Bot blocked by user
+            return DEACTIVATE
+            
+        except TelegramBadRequest as e:
+            # Chat not found or other issue
+            logger.warning("broadcast_bad_request", chat_id=chat_id, error=str(e))
+            if "chat not found" in str(e).lower():
+                return DEACTIVATE
+            return FAILED
+            
+        except TelegramRetryAfter as e:
+            # Flood control - hold back every sender, then retry once
+            logger.warning("broadcast_flood_wait", seconds=e.retry_after)
+            self.limiter.defer(e.retry_after)
+            await self.limiter.acquire()
             try:
-                # Attach keyboard only for admin
-                reply_markup = admin_kb if subscriber.chat_id == admin_id else None
-                
                 await self.bot.send_message(
-                    chat_id=subscriber.chat_id,
+                    chat_id=chat_id,
                     text=text,
                     parse_mode=parse_mode,
                     disable_web_page_preview=disable_web_page_preview,
                     reply_markup=reply_markup
                 )
-                sent += 1
-
+                return SENT
             except TelegramForbiddenError:
-                deactivated.append(subscriber.chat_id)
-                failed += 1
+                return DEACTIVATE
+            except Exception:
+                return FAILED
                 
-            except TelegramRetryAfter as e:
-                await asyncio.sleep(e.retry_after)
-                try:
-                    await self.bot.send_message(
-                        chat_id=subscriber.chat_id,
-                        text=text,
-                        parse_mode=parse_mode,
-                        disable_web_page_preview=disable_web_page_preview
-                    )
-                    sent += 1
-                except Exception:
-                    failed += 1
-                    
-            except Exception as e:
-                failed += 1
-                logger.debug("send_error", chat_id=subscriber.chat_id, error=str(e))
-            
-            await asyncio.sleep(self.delay)
-        
-        # Deactivate blocked users
-        if deactivated:
-            async with get_session() as session:
-                for chat_id in deactivated:
-                    await SubscriberRepository.set_active(session, chat_id, False)
-                await session.commit()
-        
-        return sent, failed
+        except Exception as e:
+            logger.error("broadcast_error", chat_id=chat_id, error=str(e))
+            return FAILED
@@ -12,10 +12,10 @@ project_dir = Path(__file__).parent
 print("🧹 Cleaning up project...")
 
 # Remove all .md files
-md_files = list(project_dir.glob("*.md"))
+md_files = [e for e in os.scandir(project_dir) if e.name.endswith(".md") and e.is_file()]
 for md_file in md_files:
     try:
-        md_file.unlink()
+        os.unlink(md_file.path)
         print(f"  ✓ Removed: {md_file.name}")
     except Exception as e:
         print(f"  ✗ Error removing {md_file.name}: {e}")
@@ -58,11 +58,14 @@ core_files = [
     ".gitignore"
 ]
 
+# One directory read; DirEntry caches type and stat info
+entries = {e.name: e for e in os.scandir(project_dir)}
+
 for file in core_files:
-    file_path = project_dir / file
-    if file_path.exists():
-        if file_path.is_file():
-            size = file_path.stat().st_size
+    entry = entries.get(file)
+    if entry is not None:
+        if entry.is_file():
+            size = entry.stat(follow_symlinks=False).st_size
             print(f"  ✓ {file} ({size:,} bytes)")
         else:
             print(f"  ✓ {file}")
@@ -1,12 +1,63 @@
-from typing import List
+import json
+import os
+import sys
+from dataclasses import dataclass
+from functools import cached_property
+from typing import List, Optional, Tuple
 import secrets as cfg
 
 
+@dataclass(slots=True, frozen=True)
+class RssSource:
+    name: str
+    url: str
+    category: str
+    region: Optional[str] = None
+    
+    def __post_init__(self):
+        # A handful of categories repeated across all sources: share one str each
+        object.__setattr__(self, "category", sys.intern(self.category))
+
+
+@dataclass(slots=True, frozen=True)
+class WebSource:
+    name: str
+    url: str
+    category: str
+    type: str
+    
+    def __post_init__(self):
+        object.__setattr__(self, "category", sys.intern(self.category))
+        object.__setattr__(self, "type", sys.intern(self.type))
+
+
+def unique_by_url(sources) -> Tuple[RssSource, ...]:
+    """Drop sources whose feed URL is already listed (first entry wins)."""
+    by_url = {}
+    for source in sources:
+        if source.url in by_url:
+            print(f"Duplicate RSS URL skipped: {source.name} (same as {by_url[source.url].name}): {source.url}")
+            continue
+        by_url[source.url] = source
+    return tuple(by_url.values())
+
+
+# Used when sources.json is missing or unreadable
+DEFAULT_RSS_SOURCES: Tuple[RssSource, ...] = (
+    RssSource("Яндекс ЖКХ", "https://news.yandex.ru/housing_and_public_utilities.rss", "aggregator"),
+    RssSource("Яндекс Происшествия", "https://news.yandex.ru/incident.rss", "aggregator"),
+    RssSource("РИА Новости", "https://ria.ru/export/rss2/archive/index.xml", "federal"),
+    RssSource("ТАСС", "https://tass.ru/rss/v2.xml", "federal"),
+    RssSource("МЧС России", "http://www.mchs.gov.ru/news/rss/", "emergency"),
+)
+
+
 class Config:
     # --- API Configuration ---
     PERPLEXITY_API_KEY: str = cfg.PERPLEXITY_API_KEY
     PERPLEXITY_API_BASE: str = cfg.PERPLEXITY_API_BASE
     PERPLEXITY_MODEL: str = cfg.PERPLEXITY_MODEL
+    PERPLEXITY_MODEL_SMALL: str = cfg.PERPLEXITY_MODEL_SMALL
     TELEGRAM_BOT_TOKEN: str = cfg.TELEGRAM_BOT_TOKEN
     BOT_PASSWORD: str = cfg.BOT_PASSWORD
     
@@ -54,26 +105,41 @@ class Config:
     LLM_URGENCY_THRESHOLD: int = 3
     
     LLM_URGENCY_THRESHOLD: int = 3
+    # Small-model results this close to LLM_RELEVANCE_THRESHOLD are re-checked by the large model
+    LLM_ESCALATION_MARGIN: float = 0.1
+    
+    # LLM response cache (exact request match)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_TTL_HOURS: int = 24
+    
+    # Structured output: response_format=json_object + streamed completions.
+    # Off by default: Perplexity rejects json_object (markdown-fenced JSON is
+    # parsed instead). If the API answers 400, JSON mode is switched off anyway.
+    LLM_JSON_MODE: bool = False
     
-    @property
-    def RSS_SOURCES(self) -> List[dict]:
-        import json
-        import os
+    # Local pre-LLM classifier (fastText .ftz/.bin or .onnx); articles it
+    # scores below LOCAL_CLASSIFIER_REJECT_BELOW skip the LLM entirely
+    LOCAL_CLASSIFIER_PATH: str = "local_classifier.ftz"
+    LOCAL_CLASSIFIER_REJECT_BELOW: float = 0.2
+    
+    @cached_property
+    def RSS_SOURCES(self) -> Tuple[RssSource, ...]:
+        # Read once per instance; call reload_sources() after editing sources.json
         try:
             if os.path.exists('sources.json'):
                 with open('sources.json', 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    return unique_by_url(
+                        RssSource(s["name"], s["url"], s.get("category", "general"), s.get("region"))
+                        for s in json.load(f)
+                    )
         except Exception as e:
             print(f"Error loading sources.json: {e}")
             
-        return [
-            {"name": "Google", "url": "https://news.yandex.ru/housing_and_public_utilities.rss", "category": "test"},
-            {"name": "Яндекс ЖКХ", "url": "https://news.yandex.ru/housing_and_public_utilities.rss", "category": "aggregator"},
-            {"name": "Яндекс Происшествия", "url": "https://news.yandex.ru/incident.rss", "category": "aggregator"},
-            {"name": "РИА Новости", "url": "https://ria.ru/export/rss2/archive/index.xml", "category": "federal"},
-            {"name": "ТАСС", "url": "https://tass.ru/rss/v2.xml", "category": "federal"},
-            {"name": "МЧС России", "url": "http://www.mchs.gov.ru/news/rss/", "category": "emergency"},
-        ]
+        return DEFAULT_RSS_SOURCES
+        
+    def reload_sources(self) -> None:
+        """Drop the cached RSS_SOURCES so the next access re-reads sources.json."""
+        self.__dict__.pop('RSS_SOURCES', None)
         
     def get_sources(self):
         # Helper since we changed RSS_SOURCES to property we need to instantiate or handle 
@@ -82,29 +148,35 @@ class Config:
         # The code uses `config.RSS_SOURCES` where `config` is an INSTANCE in `config.py`.
         # Let's check `config.py` end of file.
         return self.RSS_SOURCES
-    WEB_SOURCES: List[dict] = [
-        {"name": "Закупки.gov.ru", "url": "https://zakupki.gov.ru/epz/main/public/home.html", "category": "procurement", "type": "web_scraping"},
-        {"name": "TenderGuru", "url": "https://www.tenderguru.ru", "category": "procurement", "type": "api"},
-        {"name": "РосТендер", "url": "https://rostender.info", "category": "procurement", "type": "web_scraping"},
-        {"name": "Ros-Tender.ru", "url": "https://ros-tender.ru", "category": "procurement", "type": "web_scraping"},
-        {"name": "Сбербанк-АСТ", "url": "https://www.sberbank-ast.ru", "category": "procurement", "type": "web_scraping"},
-        {"name": "РТС-Тендер", "url": "https://www.rts-tender.ru", "category": "procurement", "type": "web_scraping"},
-        {"name": "Росэлторг", "url": "https://www.roseltorg.ru", "category": "procurement", "type": "web_scraping"},
-        {"name": "ЭТП ЕТС", "url": "https://etp-ets.ru", "category": "procurement", "type": "web_scraping"},
-        {"name": "ТЭК-Торг", "url": "https://tek-torg.ru", "category": "procurement", "type": "web_scraping"},
-        {"name": "B2B-Center", "url": "https://b2b-center.ru", "category": "procurement", "type": "web_scraping"},
-        {"name": "Росстат", "url": "https://rosstat.gov.ru", "category": "statistics", "type": "web_scraping"},
-        {"name": "TrueStats", "url": "https://truestats.ru", "category": "statistics", "type": "web_scraping"},
-        {"name": "StatBase", "url": "https://statbase.ru", "category": "statistics", "type": "web_scraping"},
-        {"name": "ClearSpending", "url": "https://clearspending.ru", "category": "procurement_analytics", "type": "web_scraping"},
-    ]
+    WEB_SOURCES: Tuple[WebSource, ...] = (
+        WebSource("Закупки.gov.ru", "https://zakupki.gov.ru/epz/main/public/home.html", "procurement", "web_scraping"),
+        WebSource("TenderGuru", "https://www.tenderguru.ru", "procurement", "api"),
+        WebSource("РосТендер", "https://rostender.info", "procurement", "web_scraping"),
+        WebSource("Ros-Tender.ru", "https://ros-tender.ru", "procurement", "web_scraping"),
+        WebSource("Сбербанк-АСТ", "https://www.sberbank-ast.ru", "procurement", "web_scraping"),
+        WebSource("РТС-Тендер", "https://www.rts-tender.ru", "procurement", "web_scraping"),
+        WebSource("Росэлторг", "https://www.roseltorg.ru", "procurement", "web_scraping"),
+        WebSource("ЭТП ЕТС", "https://etp-ets.ru", "procurement", "web_scraping"),
+        WebSource("ТЭК-Торг", "https://tek-torg.ru", "procurement", "web_scraping"),
+        WebSource("B2B-Center", "https://b2b-center.ru", "procurement", "web_scraping"),
+        WebSource("Росстат", "https://rosstat.gov.ru", "statistics", "web_scraping"),
+        WebSource("TrueStats", "https://truestats.ru", "statistics", "web_scraping"),
+        WebSource("StatBase", "https://statbase.ru", "statistics", "web_scraping"),
+        WebSource("ClearSpending", "https://clearspending.ru", "procurement_analytics", "web_scraping"),
+    )
+    
+    # Set by the first successful validate(); the settings never change at runtime
+    _validated: bool = False
     
     @classmethod
     def validate(cls) -> bool:
+        if cls._validated:
+            return True
         if not cls.PERPLEXITY_API_KEY:
             raise ValueError("PERPLEXITY_API_KEY is required")
         if not cls.TELEGRAM_BOT_TOKEN:
             raise ValueError("TELEGRAM_BOT_TOKEN is required")
+        cls._validated = True
         return True
 
 
@@ -1,12 +1,54 @@
 """YAML config loader with DB overrides support."""
-import yaml
+import copy
+import hashlib
+import os
+import pickle
+import threading
+from collections import Counter
+from functools import cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, Optional
-from pydantic import BaseModel, Field
-from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, get_args, get_origin
+from dataclasses import dataclass, field, fields, is_dataclass
 
+from logging_setup import get_logger
 
-class SourceConfig(BaseModel):
+logger = get_logger("config.loader")
+
+
+@cache
+def _yaml_loader():
+    """(yaml module, safe loader class), imported on first parse only.
+    
+    A valid snapshot means the YAML is never parsed, so startup skips
+    importing PyYAML entirely.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        loader = yaml.SafeLoader
+        logger.warning("yaml_libyaml_missing", hint="install libyaml-dev and reinstall PyYAML for the C loader")
+    return yaml, loader
+
+
+# Default list values, defined once; each config instance gets its own list copy
+_URL_PARAMS_TO_REMOVE = (
+    "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
+    "yclid", "gclid", "fbclid", "ref", "from", "source", "rss", "tg"
+)
+_EVENT_CATEGORIES = ("accident", "repair")
+_OBJECT_CATEGORIES = ("infrastructure", "industrial")
+_STRONG_EVENT_PHRASES = (
+    "авария на водоканале", "прорыв трубопровода", "отключение отопления",
+    "затопление", "ЧП на объекте", "массовое отключение", "разлив нефти",
+    "взрыв на производстве", "обрушение", "пожар на объекте"
+)
+_BACKOFF_ON_429_SECONDS = (2, 5, 10, 20, 40)
+
+
+@dataclass(slots=True, kw_only=True)
+class SourceConfig:
     """Single source configuration."""
     id: str
     type: str = "rss"  # rss, web, google_news_rss
@@ -19,13 +61,15 @@ class SourceConfig(BaseModel):
     ceid: str = "RU:ru"
 
 
-class KeywordsConfig(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class KeywordsConfig:
     """Keywords configuration."""
-    positive: Dict[str, list[str]] = Field(default_factory=dict)
-    negative: list[str] = Field(default_factory=list)
+    positive: Dict[str, list[str]] = field(default_factory=dict)
+    negative: list[str] = field(default_factory=list)
 
 
-class WeightsConfig(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class WeightsConfig:
     """Scoring weights."""
     accident: int = 3
     repair: int = 2
@@ -34,97 +78,104 @@ class WeightsConfig(BaseModel):
     negative: int = -5
 
 
-class ThresholdsConfig(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ThresholdsConfig:
     """Filtering thresholds."""
     filter1_to_llm: int = 4
     llm_relevance: float = 0.6
     llm_urgency: int = 3
 
 
-class LimitsConfig(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class LimitsConfig:
     """System limits."""
     max_signals_per_day: int = 5
     max_processing_batch: int = 100  # Max news items to process per cycle
 
 
-class DedupConfig(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class DedupConfig:
     """Deduplication settings."""
     simhash_threshold: int = 3
-    url_params_to_remove: list[str] = Field(default_factory=lambda: [
-        "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
-        "yclid", "gclid", "fbclid", "ref", "from", "source", "rss", "tg"
-    ])
+    url_params_to_remove: list[str] = field(default_factory=lambda: list(_URL_PARAMS_TO_REMOVE))
+    # Lowercased lookup set built once from url_params_to_remove
+    url_params_to_remove_set: frozenset[str] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.url_params_to_remove_set = frozenset(p.lower() for p in self.url_params_to_remove)
 
 
-class HttpConfig(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class HttpConfig:
     """HTTP client settings."""
     timeout: int = 15
     retries: int = 3
 
 
-class ScheduleConfig(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ScheduleConfig:
     """Scheduler settings."""
     check_interval_minutes: int = 30
 
 
-class FreshnessConfig(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class FreshnessConfig:
     """Freshness filter settings."""
     max_age_days: int = 2
     allow_missing_published_at: bool = True
     fallback_to_collected_at: bool = True
 
 
-class PriorityScoreConfig(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class PriorityScoreConfig:
     """Priority score calculation weights for ranking candidates."""
     urgency_weight: float = 0.4      # 1-5 scaled to 0-1 
     relevance_weight: float = 0.4    # 0-1 from LLM
     filter1_weight: float = 0.2      # Normalized filter1 score
 
 
-class ResolvedFilterConfig(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ResolvedFilterConfig:
     """Resolved (already fixed) filter settings."""
     enabled: bool = True
-    hard_resolved_phrases: list[str] = Field(default_factory=list)
-    soft_resolved_words: list[str] = Field(default_factory=list)
-    allow_if_still_ongoing_words: list[str] = Field(default_factory=list)
+    hard_resolved_phrases: list[str] = field(default_factory=list)
+    soft_resolved_words: list[str] = field(default_factory=list)
+    allow_if_still_ongoing_words: list[str] = field(default_factory=list)
     mode: str = "block_resolved"
 
 
-class NoiseFilterConfig(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class NoiseFilterConfig:
     """Noise (death/crime) filter settings."""
     enabled: bool = True
-    hard_negative_topics: list[str] = Field(default_factory=list)
-    household_noise: list[str] = Field(default_factory=list)
-    exception_infra_phrases: list[str] = Field(default_factory=list)
-    
-    class Config:
-        populate_by_name = True
+    hard_negative_topics: list[str] = field(default_factory=list)
+    household_noise: list[str] = field(default_factory=list)
+    exception_infra_phrases: list[str] = field(default_factory=list)
 
 
-class Filter1GateConfig(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Filter1GateConfig:
     """Filter1 combo gate settings."""
     require_combo_to_llm: bool = True
-    event_categories_required: list[str] = Field(default_factory=lambda: ["accident", "repair"])
-    object_categories_required: list[str] = Field(default_factory=lambda: ["infrastructure", "industrial"])
+    event_categories_required: list[str] = field(default_factory=lambda: list(_EVENT_CATEGORIES))
+    object_categories_required: list[str] = field(default_factory=lambda: list(_OBJECT_CATEGORIES))
     strong_event_override_enabled: bool = True
-    strong_event_override_phrases: list[str] = Field(default_factory=lambda: [
-        "авария на водоканале", "прорыв трубопровода", "отключение отопления",
-        "затопление", "ЧП на объекте", "массовое отключение", "разлив нефти",
-        "взрыв на производстве", "обрушение", "пожар на объекте"
-    ])
+    strong_event_override_phrases: list[str] = field(default_factory=lambda: list(_STRONG_EVENT_PHRASES))
 
 
-class LLMThrottleConfig(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class LLMThrottleConfig:
     """LLM throttling settings."""
     max_requests_per_cycle: int = 30
     max_requests_per_minute: int = 30
     concurrency: int = 1
-    backoff_on_429_seconds: list[int] = Field(default_factory=lambda: [2, 5, 10, 20, 40])
+    backoff_on_429_seconds: list[int] = field(default_factory=lambda: list(_BACKOFF_ON_429_SECONDS))
     max_consecutive_429: int = 3
     max_candidates_after_filter1: int = 200  # Limit candidates sent to LLM
 
 
-class UIMessagesConfig(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class UIMessagesConfig:
     """UI message templates."""
     welcome_new: str = (
         "🚀 <b>Добро пожаловать в PRSBOT!</b>\n\n"
@@ -177,106 +228,360 @@ class UIMessagesConfig(BaseModel):
     )
 
 
-class UIConfig(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class UIConfig:
     """UI settings."""
-    messages: UIMessagesConfig = Field(default_factory=UIMessagesConfig)
+    messages: UIMessagesConfig = field(default_factory=UIMessagesConfig)
 
 
-class AppConfig(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class AppConfig:
     """Complete application configuration."""
-    sources: list[SourceConfig] = Field(default_factory=list)
-    keywords: KeywordsConfig = Field(default_factory=KeywordsConfig)
-    weights: WeightsConfig = Field(default_factory=WeightsConfig)
-    thresholds: ThresholdsConfig = Field(default_factory=ThresholdsConfig)
-    limits: LimitsConfig = Field(default_factory=LimitsConfig)
-    dedup: DedupConfig = Field(default_factory=DedupConfig)
-    http: HttpConfig = Field(default_factory=HttpConfig)
-    schedule: ScheduleConfig = Field(default_factory=ScheduleConfig)
+    sources: list[SourceConfig] = field(default_factory=list)
+    keywords: KeywordsConfig = field(default_factory=KeywordsConfig)
+    weights: WeightsConfig = field(default_factory=WeightsConfig)
+    thresholds: ThresholdsConfig = field(default_factory=ThresholdsConfig)
+    limits: LimitsConfig = field(default_factory=LimitsConfig)
+    dedup: DedupConfig = field(default_factory=DedupConfig)
+    http: HttpConfig = field(default_factory=HttpConfig)
+    schedule: ScheduleConfig = field(default_factory=ScheduleConfig)
     # New quality filters
-    freshness: FreshnessConfig = Field(default_factory=FreshnessConfig)
-    resolved_filter: ResolvedFilterConfig = Field(default_factory=ResolvedFilterConfig)
-    noise_filter: NoiseFilterConfig = Field(default_factory=NoiseFilterConfig)
-    filter1_gate: Filter1GateConfig = Field(default_factory=Filter1GateConfig)
-    llm_throttle: LLMThrottleConfig = Field(default_factory=LLMThrottleConfig)
-    priority_score: PriorityScoreConfig = Field(default_factory=PriorityScoreConfig)
-    ui: UIConfig = Field(default_factory=UIConfig)
+    freshness: FreshnessConfig = field(default_factory=FreshnessConfig)
+    resolved_filter: ResolvedFilterConfig = field(default_factory=ResolvedFilterConfig)
+    noise_filter: NoiseFilterConfig = field(default_factory=NoiseFilterConfig)
+    filter1_gate: Filter1GateConfig = field(default_factory=Filter1GateConfig)
+    llm_throttle: LLMThrottleConfig = field(default_factory=LLMThrottleConfig)
+    priority_score: PriorityScoreConfig = field(default_factory=PriorityScoreConfig)
+    ui: UIConfig = field(default_factory=UIConfig)
+
+
+def _from_dict(cls, data: Optional[dict]):
+    """Build a config dataclass from YAML data.
+    
+    Nested sections and lists of sections are converted recursively,
+    ints are widened for float fields and unknown keys are ignored.
+    """
+    if not data:
+        return cls()
+    kwargs = {}
+    for f in fields(cls):
+        if not f.init or f.name not in data:
+            continue
+        value = data[f.name]
+        if is_dataclass(f.type):
+            value = _from_dict(f.type, value)
+        elif get_origin(f.type) is list and value is not None:
+            (item_type,) = get_args(f.type) or (None,)
+            if is_dataclass(item_type):
+                # Convert in place: each YAML dict is released as soon as
+                # its dataclass exists, and no second list is allocated
+                for i, item in enumerate(value):
+                    value[i] = _from_dict(item_type, item)
+        elif f.type is float and isinstance(value, int):
+            value = float(value)
+        kwargs[f.name] = value
+    return cls(**kwargs)
+
+
+def _to_bool(value: Any) -> bool:
+    return str(value).lower() in ("true", "1", "yes")
+
+
+# Override values arrive as strings from the DB; coerce by declared field type.
+# Only these scalar fields can be overridden: a string assigned to a list or
+# dict field would be iterated per character by the filters.
+_COERCE: Dict[type, Callable[[Any], Any]] = {bool: _to_bool, int: int, float: float, str: str}
+
+
+def _make_setter(section: tuple, name: str, coerce: Callable[[Any], Any]) -> Callable[[AppConfig, Any], None]:
+    get_section = attrgetter(".".join(section)) if section else None
+    
+    def setter(config: AppConfig, value: Any) -> None:
+        obj = get_section(config) if get_section else config
+        setattr(obj, name, coerce(value))
+        # Recompute fields derived from the section's values (e.g. url_params_to_remove_set)
+        post_init = getattr(obj, "__post_init__", None)
+        if post_init is not None:
+            post_init()
+    
+    return setter
+
+
+def _build_setters(cls, section: tuple = ()) -> Dict[str, Callable[[AppConfig, Any], None]]:
+    """Dotted override key -> setter, for every scalar leaf field of a config dataclass.
+    
+    List and dict fields get no setter, so overrides for them are reported
+    as not applied (see set_overrides).
+    """
+    setters = {}
+    for f in fields(cls):
+        if not f.init:
+            continue
+        if is_dataclass(f.type):
+            setters.update(_build_setters(f.type, section + (f.name,)))
+        elif f.type in _COERCE:
+            key = ".".join(section + (f.name,))
+            setters[key] = _make_setter(section, f.name, _COERCE[f.type])
+    return setters
+
+
+# Compiled once from the AppConfig schema; unknown override keys are ignored
+_SETTERS = _build_setters(AppConfig)
+
+
+# Resolved once; ConfigLoader() falls back to it when no path is given
+_DEFAULT_CONFIG_PATH = (Path(__file__).resolve().parent / "config" / "config.yaml")
 
 
 class ConfigLoader:
     """Load configuration from YAML with DB overrides."""
     
     def __init__(self, config_path: Path = None):
-        self.config_path = config_path or Path(__file__).parent / "config" / "config.yaml"
+        self.config_path = config_path or _DEFAULT_CONFIG_PATH
         self._config: Optional[AppConfig] = None
+        # Copy of the config as parsed, before overrides (baseline for get_diff)
+        self._base_config: Optional[AppConfig] = None
         self._overrides: Dict[str, Any] = {}
+        # (mtime_ns, size) of the YAML the current config was parsed from,
+        # and the overrides already applied on top of it
+        self._cache_key: Optional[tuple] = None
+        self._applied_overrides: Dict[str, Any] = {}
+        # Source indexes, rebuilt on every (re)load
+        self._counts_by_type: Counter = Counter()
+        self._names_lower: list[tuple[str, SourceConfig]] = []
+        # Pre-rendered admin texts (HTML), rebuilt on load / override change
+        self._sources_summary: str = ""
+        self._config_summary: str = ""
+        # Set by the file watcher (see watch()) when config.yaml changes
+        self._dirty = False
+        self._observer = None
     
-    def load(self) -> AppConfig:
-        """Load configuration from YAML file."""
-        if not self.config_path.exists():
-            # Return default config if file doesn't exist
-            self._config = AppConfig()
-            return self._config
+    def _file_key(self) -> Optional[tuple]:
+        """(mtime_ns, size) of the YAML file, or None if it doesn't exist."""
+        try:
+            st = os.stat(self.config_path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def load(self, force: bool = False) -> AppConfig:
+        """Load configuration from YAML file.
         
-        with open(self.config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        The parsed config is reused while the file's mtime and size are
+        unchanged; pass force=True to re-parse anyway.
+        """
+        cache_key = self._file_key()
+        if not force and self._config is not None and cache_key == self._cache_key:
+            if self._overrides != self._applied_overrides:
+                self._apply_overrides()
+                self._render_config_summary()
+            return self._config
         
-        # Parse sources
-        sources = []
-        for src in data.get("sources", []):
-            sources.append(SourceConfig(**src))
-        data["sources"] = sources
+        if cache_key is None:
+            # Default config if file doesn't exist
+            self._config = AppConfig()
+        else:
+            with open(self.config_path, "rb") as f:
+                raw = f.read()
+            digest = self._snapshot_digest(raw)
+            self._config = self._read_snapshot(digest)
+            if self._config is None:
+                self._config = self._parse(raw)
+                self._write_snapshot(digest, self._config)
         
-        self._config = AppConfig(**data)
+        self._base_config = copy.deepcopy(self._config)
+        self._cache_key = cache_key
+        self._index_sources()
         self._apply_overrides()
+        self._render_config_summary()
         return self._config
     
+    @staticmethod
+    def _parse(raw: bytes) -> AppConfig:
+        """Parse YAML content into config dataclasses."""
+        yaml, loader = _yaml_loader()
+        data = yaml.load(raw, Loader=loader) or {}
+        return _from_dict(AppConfig, data)
+    
+    @property
+    def _snapshot_path(self) -> Path:
+        """Pickled AppConfig next to the YAML (config.yaml -> config.yaml.pkl)."""
+        return self.config_path.with_name(self.config_path.name + ".pkl")
+    
+    @staticmethod
+    def _snapshot_digest(raw: bytes) -> str:
+        """Hash of the YAML content plus this module's mtime (model definitions)."""
+        h = hashlib.blake2b(raw, digest_size=16)
+        h.update(str(os.stat(__file__).st_mtime_ns).encode())
+        return h.hexdigest()
+    
+    def _read_snapshot(self, digest: str) -> Optional[AppConfig]:
+        """Validated config from the snapshot, if it was written for this YAML."""
+        try:
+            with open(self._snapshot_path, "rb") as f:
+                if f.readline().rstrip(b"\n").decode() != digest:
+                    return None
+                return pickle.load(f)
+        except Exception:
+            return None
+    
+    def _write_snapshot(self, digest: str, config: AppConfig) -> None:
+        """Atomically replace the snapshot; skipped if the directory isn't writable."""
+        tmp_path = self._snapshot_path.with_name(self._snapshot_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(digest.encode() + b"\n")
+                pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._snapshot_path)
+        except OSError:
+            pass
+    
+    def _index_sources(self) -> None:
+        """Build per-type counts and a lowercased name index for sources."""
+        counts = Counter()
+        names_lower = []
+        for s in self._config.sources:
+            counts[s.type] += 1
+            names_lower.append((s.name.lower(), s))
+        self._counts_by_type = counts
+        self._names_lower = names_lower
+        
+        sources = self._config.sources
+        sample = "\n".join(f"• {s.name}" for s in sources[:10])
+        self._sources_summary = (
+            f"📡 <b>Источники ({len(sources)})</b>\n\n"
+            f"RSS: {counts['rss']}\n"
+            f"Web: {counts['web']}\n"
+            f"Google News: {counts['google_news_rss']}\n\n"
+            f"<b>Примеры:</b>\n{sample}\n"
+            f"... и ещё {max(0, len(sources) - 10)}"
+        )
+    
+    def _render_config_summary(self) -> None:
+        """Pre-render the /config_show text from the effective config."""
+        config = self._config
+        self._config_summary = (
+            f"⚙️ <b>Конфигурация</b>\n\n"
+            f"<b>Пороги:</b>\n"
+            f"• filter1_to_llm: {config.thresholds.filter1_to_llm}\n"
+            f"• llm_relevance: {config.thresholds.llm_relevance}\n"
+            f"• llm_urgency: {config.thresholds.llm_urgency}\n\n"
+            f"<b>Лимиты:</b>\n"
+            f"• max_signals_per_day: {config.limits.max_signals_per_day}\n\n"
+            f"<b>Дедупликация:</b>\n"
+            f"• simhash_threshold: {config.dedup.simhash_threshold}\n\n"
+            f"<b>Расписание:</b>\n"
+            f"• check_interval: {config.schedule.check_interval_minutes} мин"
+        )
+    
+    @property
+    def sources_summary(self) -> str:
+        """Pre-rendered /sources_list text (HTML)."""
+        if self._config is None:
+            self.load()
+        return self._sources_summary
+    
+    @property
+    def config_summary(self) -> str:
+        """Pre-rendered /config_show text (HTML)."""
+        if self._config is None:
+            self.load()
+        return self._config_summary
+    
+    def counts_by_type(self) -> Counter:
+        """Get number of sources per type (rss, web, google_news_rss)."""
+        if self._config is None:
+            self.load()
+        return self._counts_by_type
+    
+    def search_sources(self, query: str) -> list[SourceConfig]:
+        """Find sources whose name contains the (case-insensitive) query."""
+        if self._config is None:
+            self.load()
+        query = query.lower()
+        return [s for name, s in self._names_lower if query in name]
+    
     def set_overrides(self, overrides: Dict[str, Any]) -> None:
-        """Set DB overrides to apply on top of YAML config."""
+        """Set DB overrides to apply on top of YAML config.
+        
+        Keys that aren't AppConfig fields are kept (get_diff shows them) but
+        never applied; they are reported once here rather than on every apply.
+        """
+        unknown = [key for key in overrides if key not in _SETTERS]
+        if unknown:
+            logger.info("config_overrides_not_applied", keys=unknown)
         self._overrides = overrides
         if self._config:
             self._apply_overrides()
+            self._render_config_summary()
     
     def _apply_overrides(self) -> None:
         """Apply DB overrides to current config."""
-        if not self._config or not self._overrides:
+        # Overrides dropped since the last apply go back to their YAML values
+        removed = self._applied_overrides.keys() - self._overrides.keys()
+        self._applied_overrides = dict(self._overrides)
+        if not self._config:
+            return
+        if self._base_config is not None:
+            for key in removed:
+                setter = _SETTERS.get(key)
+                if setter:
+                    setter(self._config, attrgetter(key)(self._base_config))
+        if not self._overrides:
             return
         
         for key, value in self._overrides.items():
-            self._set_nested(key, value)
+            setter = _SETTERS.get(key)
+            if setter:
+                setter(self._config, value)
     
-    def _set_nested(self, key: str, value: Any) -> None:
-        """Set a nested config value using dot notation."""
-        parts = key.split(".")
-        obj = self._config
-        
-        for part in parts[:-1]:
-            if hasattr(obj, part):
-                obj = getattr(obj, part)
-            else:
-                return
-        
-        final_key = parts[-1]
-        if hasattr(obj, final_key):
-            # Convert value to appropriate type
-            current = getattr(obj, final_key)
-            if isinstance(current, int):
-                value = int(value)
-            elif isinstance(current, float):
-                value = float(value)
-            elif isinstance(current, bool):
-                value = str(value).lower() in ("true", "1", "yes")
-            setattr(obj, final_key, value)
-    
-    def reload(self) -> AppConfig:
-        """Reload configuration from file."""
-        return self.load()
+    def reload(self, force: bool = False) -> AppConfig:
+        """Reload configuration from file (no-op if it hasn't changed, unless forced)."""
+        return self.load(force=force)
     
     @property
     def config(self) -> AppConfig:
-        """Get current config, loading if necessary."""
-        if self._config is None:
+        """Get current config, loading if necessary (or if the watched file changed)."""
+        if self._config is None or self._dirty:
+            self._dirty = False
             self.load()
         return self._config
+    
+    def watch(self) -> bool:
+        """Reload on the next `config` access after config.yaml changes.
+        
+        Uses a watchdog observer (inotify on Linux) on the config directory,
+        so nothing is polled between changes. Returns False if watchdog
+        isn't installed; callers then keep using reload().
+        """
+        if self._observer is not None:
+            return True
+        if not self.config_path.parent.is_dir():
+            return False
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logger.warning("watchdog_missing", hint="config changes need /reload_config")
+            return False
+        
+        loader = self
+        name = self.config_path.name
+        
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                # Editors often save via rename, so check the destination too
+                paths = (event.src_path, getattr(event, "dest_path", ""))
+                if any(os.path.basename(p) == name for p in paths):
+                    loader._dirty = True
+        
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(_Handler(), str(self.config_path.parent), recursive=False)
+        observer.start()
+        self._observer = observer
+        logger.info("config_watch_started", path=str(self.config_path))
+        return True
 
     def get_diff(self) -> Dict[str, Dict[str, Any]]:
         """Get diff between overrides and base config.
@@ -288,10 +593,7 @@ class ConfigLoader:
             self.load()
             
         diff = {}
-        # Temporarily reload base without overrides to get baseline
-        # (Inefficient but safe)
-        base_loader = ConfigLoader(self.config_path)
-        base_config = base_loader.load()
+        base_config = self._base_config
         
         for key, value in self._overrides.items():
             # Get base value
@@ -322,14 +624,24 @@ class ConfigLoader:
 
 # Global config loader instance
 _loader: Optional[ConfigLoader] = None
+_loader_lock = threading.Lock()
 
 
 def get_config_loader() -> ConfigLoader:
-    """Get global config loader instance."""
+    """Get global config loader instance.
+    
+    Double-checked: once created, callers only read the global; the lock
+    is taken just for the first construction, so concurrent workers can't
+    end up with separate loaders (and separate overrides).
+    """
     global _loader
-    if _loader is None:
-        _loader = ConfigLoader()
-    return _loader
+    loader = _loader
+    if loader is None:
+        with _loader_lock:
+            if _loader is None:
+                _loader = ConfigLoader()
+            loader = _loader
+    return loader
 
 
 def get_config() -> AppConfig:
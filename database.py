@@ -1,34 +1,66 @@
 import sqlite3
-from datetime import datetime
-from typing import Optional, List
-from contextlib import contextmanager
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta
+from typing import Iterable, Optional, List, Set, Tuple
 from config import config
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Per-connection settings (journal_mode=WAL is persistent, set once in _init_db)
+CONNECTION_PRAGMAS = """
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -65536;
+    PRAGMA mmap_size = 268435456;
+"""
+
+ArticleRow = namedtuple(
+    "ArticleRow",
+    "id title url content source category published_at collected_at processed content_hash"
+)
+ARTICLE_COLUMNS = ", ".join(ArticleRow._fields)
+
+
+def _article_row(cursor, row) -> ArticleRow:
+    return ArticleRow._make(row)
+
 
 class Database:
     def __init__(self, db_path: str = None):
         self.db_path = db_path or config.DB_PATH
+        # One long-lived connection per thread (the collector's worker pool
+        # shares the module-level db); closed when its thread exits
+        self._local = threading.local()
         self._init_db()
     
-    @contextmanager
-    def get_connection(self):
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Database error: {e}")
-            raise
-        finally:
+    def get_connection(self) -> sqlite3.Connection:
+        """This thread's connection; use as `with db.get_connection() as conn:`.
+
+        The connection's own context manager commits on success and rolls
+        back on error (it does not close the connection).
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.executescript(CONNECTION_PRAGMAS)
+            self._local.conn = conn
+        return conn
+    
+    def close(self):
+        """Close the calling thread's connection (reopened on next use)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
             conn.close()
+            self._local.conn = None
     
     def _init_db(self):
         with self.get_connection() as conn:
+            # Readers (stats, bot) no longer block on the collector's writes
+            conn.execute("PRAGMA journal_mode = WAL")
             cursor = conn.cursor()
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS articles (
@@ -41,7 +73,8 @@ class Database:
                     published_at TEXT,
                     collected_at TEXT NOT NULL,
                     processed BOOLEAN DEFAULT 0,
-                    content_hash TEXT
+                    content_hash TEXT,
+                    llm_relevance REAL
                 )
             """)
             
@@ -50,6 +83,11 @@ class Database:
                 cursor.execute("ALTER TABLE articles ADD COLUMN content_hash TEXT")
             except sqlite3.OperationalError:
                 pass  # Column already exists
+            # LLM relevance verdict (NULL: never classified by the LLM)
+            try:
+                cursor.execute("ALTER TABLE articles ADD COLUMN llm_relevance REAL")
+            except sqlite3.OperationalError:
+                pass  # Column already exists
             
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS filtered_events (
@@ -87,7 +125,10 @@ class Database:
                     FOREIGN KEY (event_id) REFERENCES filtered_events (id)
                 )
             """)
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_articles_processed ON articles(processed)")
+            # (processed, collected_at) serves get_unprocessed_articles' WHERE + ORDER BY
+            # without a sort, and processed-only lookups by prefix
+            cursor.execute("DROP INDEX IF EXISTS idx_articles_processed")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_articles_unproc_collected ON articles(processed, collected_at DESC)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_articles_collected ON articles(collected_at)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_score ON filtered_events(relevance_score)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_articles_hash ON articles(content_hash)")
@@ -111,6 +152,16 @@ class Database:
                     created_at TEXT NOT NULL
                 )
             """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    expires_at INTEGER NOT NULL
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_expires ON llm_cache(expires_at)")
+            # Refresh planner statistics where they are missing or stale (cheap when up to date)
+            cursor.execute("PRAGMA optimize")
             logger.info("Database initialized successfully")
     
     def article_exists(self, article_id: str) -> bool:
@@ -119,6 +170,13 @@ class Database:
             cursor.execute("SELECT 1 FROM articles WHERE id = ?", (article_id,))
             return cursor.fetchone() is not None
             
+    def recent_article_ids(self, days: int = 2) -> Set[str]:
+        """Ids of articles collected in the last `days` days, for in-memory existence checks."""
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        with self.get_connection() as conn:
+            cursor = conn.execute("SELECT id FROM articles WHERE collected_at > ?", (cutoff,))
+            return {row[0] for row in cursor}
+            
     def article_hash_exists(self, content_hash: str) -> bool:
         if not content_hash:
             return False
@@ -144,17 +202,58 @@ class Database:
             logger.debug(f"Article already exists: {article['url']}")
             return False
     
-    def get_unprocessed_articles(self, limit: int = 100) -> List[dict]:
+    def save_articles(self, articles: List[dict]) -> List[bool]:
+        """Insert several articles in one transaction.
+
+        Returns one flag per article: False if it was already stored
+        (same id or url), which INSERT OR IGNORE skips without raising.
+        """
+        if not articles:
+            return []
+        saved = []
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM articles WHERE processed = 0 ORDER BY collected_at DESC LIMIT ?", (limit,))
-            return [dict(row) for row in cursor.fetchall()]
+            for article in articles:
+                cursor.execute("""
+                    INSERT OR IGNORE INTO articles (id, title, url, content, source, category, published_at, collected_at, content_hash)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    article['id'], article['title'], article['url'], article['content'],
+                    article['source'], article['category'], article.get('published_at'), article['collected_at'],
+                    article.get('content_hash')
+                ))
+                saved.append(cursor.rowcount == 1)
+        return saved
+    
+    def get_unprocessed_articles(self, limit: int = 100) -> List[ArticleRow]:
+        """Newest unprocessed articles as ArticleRow tuples (row.title; _asdict() if a dict is needed)."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = _article_row
+            cursor.execute(
+                f"SELECT {ARTICLE_COLUMNS} FROM articles WHERE processed = 0 ORDER BY collected_at DESC LIMIT ?",
+                (limit,)
+            )
+            return cursor.fetchall()
     
     def mark_article_processed(self, article_id: str):
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("UPDATE articles SET processed = 1 WHERE id = ?", (article_id,))
     
+    def mark_articles_processed(self, article_ids: Iterable[str]):
+        """Mark several articles processed in a single transaction."""
+        with self.get_connection() as conn:
+            conn.executemany(
+                "UPDATE articles SET processed = 1 WHERE id = ?",
+                ((article_id,) for article_id in article_ids)
+            )
+    
+    def set_llm_relevance(self, verdicts: Iterable[Tuple[float, str]]):
+        """Store LLM relevance verdicts as (relevance, article_id) pairs in one transaction."""
+        with self.get_connection() as conn:
+            conn.executemany("UPDATE articles SET llm_relevance = ? WHERE id = ?", verdicts)
+    
     def save_filtered_event(self, event: dict) -> int:
         with self.get_connection() as conn:
             cursor = conn.cursor()
@@ -181,15 +280,13 @@ class Database:
     
     def get_stats(self) -> dict:
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM articles")
-            total_articles = cursor.fetchone()[0]
-            cursor.execute("SELECT COUNT(*) FROM articles WHERE processed = 1")
-            processed_articles = cursor.fetchone()[0]
-            cursor.execute("SELECT COUNT(*) FROM filtered_events")
-            total_events = cursor.fetchone()[0]
-            cursor.execute("SELECT COUNT(*) FROM sent_signals")
-            total_signals = cursor.fetchone()[0]
+            total_articles, processed_articles, total_events, total_signals = conn.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM articles),
+                    (SELECT COUNT(*) FROM articles WHERE processed = 1),
+                    (SELECT COUNT(*) FROM filtered_events),
+                    (SELECT COUNT(*) FROM sent_signals)
+            """).fetchone()
             return {
                 'total_articles': total_articles,
                 'processed_articles': processed_articles,
@@ -199,6 +296,27 @@ class Database:
             }
 
 
+    def get_llm_cache(self, key: str) -> Optional[str]:
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT response FROM llm_cache WHERE key = ? AND expires_at > ?",
+                (key, int(time.time()))
+            )
+            row = cursor.fetchone()
+            return row[0] if row else None
+
+    def set_llm_cache(self, key: str, response: str, ttl_seconds: int):
+        now = int(time.time())
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            # Lazy GC of expired entries
+            cursor.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+            cursor.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response, expires_at) VALUES (?, ?, ?)",
+                (key, response, now + ttl_seconds)
+            )
+
     def save_user_feedback(self, event_id: str, user_id: int, vote: str):
         with self.get_connection() as conn:
             cursor = conn.cursor()
@@ -2,7 +2,8 @@
 
 # Adapted from other/3/core/normalization.py - simhash functions
 """
-from typing import Optional, List, Tuple
+from hashlib import blake2b
+from typing import Dict, Optional, List, Tuple
 import re
 
 from logging_setup import get_logger
@@ -10,16 +11,70 @@ from logging_setup import get_logger
 logger = get_logger("pipeline.dedup")
 
 
-# Try to import simhash library
+# Punctuation and symbols, dropped before hashing
+_NON_WORD = re.compile(r'[^\w\s]')
+
+# Vectorized simhash accumulation and near-duplicate scan
 try:
-    from simhash import Simhash
-    HAS_SIMHASH = True
+    import numpy as np
+    HAS_NUMPY = True
 except ImportError:
-    HAS_SIMHASH = False
-    logger.warning("simhash_not_installed", msg="Using fallback hash")
+    HAS_NUMPY = False
+
+# Below this many cached hashes the plain loop beats numpy's call overhead
+NUMPY_MIN_HASHES = 256
+# Hashes per vectorized step: bounds the temporaries and allows an early exit
+NUMPY_SCAN_BLOCK = 8192
+
+# LSH banding: 4 bands of 16 bits. Hashes within fewer than LSH_BANDS bits
+# of each other agree on at least one whole band (pigeonhole), so only
+# hashes sharing a band bucket need a Hamming check.
+LSH_BANDS = 4
+LSH_BAND_BITS = 64 // LSH_BANDS
+_BAND_MASK = (1 << LSH_BAND_BITS) - 1
+
+if HAS_NUMPY and not hasattr(np, "bitwise_count"):
+    # numpy < 2.0: popcount via a 16-bit lookup table
+    _POPCOUNT_16 = np.array([bin(i).count("1") for i in range(1 << 16)], dtype=np.uint8)
+
+
+def _popcount64(values):
+    """Per-element popcount of a uint64 array."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+    return (
+        _POPCOUNT_16[values & 0xFFFF].astype(np.uint16)
+        + _POPCOUNT_16[(values >> 16) & 0xFFFF]
+        + _POPCOUNT_16[(values >> 32) & 0xFFFF]
+        + _POPCOUNT_16[values >> 48]
+    )
+
+
+def _token_hash(word: str) -> int:
+    """Stable 64-bit hash of one token (blake2b, unlike the per-process hash())."""
+    return int.from_bytes(blake2b(word.encode("utf-8"), digest_size=8).digest(), "little")
 
 
-def compute_simhash(text: str) -> str:
+def _simhash_value(words: List[str]) -> int:
+    """64-bit SimHash: bit i is set if most token hashes have bit i set."""
+    hashes = [_token_hash(w) for w in words]
+    total = len(hashes)
+    
+    if HAS_NUMPY:
+        # (N, 64) bit matrix, little-endian bit order, summed per column
+        raw = np.array(hashes, dtype="<u8").view(np.uint8).reshape(-1, 8)
+        counts = np.unpackbits(raw, axis=1, bitorder="little").sum(axis=0)
+        bits = np.packbits(counts * 2 > total, bitorder="little")
+        return int(bits.view("<u8")[0])
+    
+    # Columns of the binary strings, most significant bit first
+    value = 0
+    for column in zip(*(f"{h:064b}" for h in hashes)):
+        value = (value << 1) | (column.count("1") * 2 > total)
+    return value
+
+
+def compute_simhash(text: str) -> int:
     """
     Compute simhash for text deduplication.
     
@@ -27,87 +82,59 @@ def compute_simhash(text: str) -> str:
         text: Text to hash (typically title + first 300-500 chars)
     
     Returns:
-        Hex string of simhash value
+        Unsigned 64-bit simhash value (0 if the text has no usable words)
     """
     if not text:
-        return "0"
+        return 0
     
     # Clean text: remove punctuation, lowercase
-    clean = re.sub(r'[^\w\s]', '', text.lower())
+    clean = _NON_WORD.sub('', text.lower())
     words = [w for w in clean.split() if len(w) > 2]
     
     if not words:
-        return "0"
+        return 0
     
-    if HAS_SIMHASH:
-        try:
-            sh = Simhash(words)
-            return hex(sh.value)[2:]  # Remove '0x' prefix
-        except Exception:
-            pass
-    
-    # Fallback: simple hash
-    return hex(hash(" ".join(words)) & 0xFFFFFFFFFFFFFFFF)[2:]
+    return _simhash_value(words)
+
 
+MASK_64 = (1 << 64) - 1
 
-def hamming_distance(hash1: str, hash2: str) -> int:
+
+def hamming_distance(hash1: int, hash2: int) -> int:
     """
-    Calculate Hamming distance between two hex hashes.
+    Calculate Hamming distance between two simhashes.
     
     Args:
-        hash1: First hex hash
-        hash2: Second hex hash
+        hash1: First simhash value
+        hash2: Second simhash value
     
     Returns:
         Number of differing bits (0-64)
     """
-    try:
-        v1 = int(hash1, 16) if hash1 else 0
-        v2 = int(hash2, 16) if hash2 else 0
-        
-        # XOR to find different bits
-        xor = (v1 ^ v2) & ((1 << 64) - 1)
-        
-        # Count set bits (Brian Kernighan's algorithm)
-        distance = 0
-        while xor:
-            distance += 1
-            xor &= xor - 1
-        
-        return distance
-    except (ValueError, TypeError):
-        return 99  # Far apart on error
+    # XOR to find different bits, popcount in C
+    return ((hash1 ^ hash2) & MASK_64).bit_count()
 
 
-def is_duplicate_by_simhash(
-    new_hash: str,
-    existing_hashes: List[Tuple[int, str]],
+def find_near_duplicate(
+    value: int,
+    existing: List[Tuple[int, int]],
     threshold: int = 3
 ) -> Optional[int]:
     """
-    Check if new hash is a duplicate of any existing hash.
-    
-    Args:
-        new_hash: Simhash of new article
-        existing_hashes: List of (news_id, simhash) tuples
-        threshold: Max hamming distance to consider duplicate
+    news_id of the first (news_id, hash value) within threshold bits of value.
     
-    Returns:
-        news_id of duplicate if found, None otherwise
+    One XOR and one popcount per entry; zero values never match.
     """
-    if not new_hash or new_hash == "0":
+    if not value:
         return None
     
-    for news_id, existing_hash in existing_hashes:
-        if not existing_hash or existing_hash == "0":
-            continue
-        
-        distance = hamming_distance(new_hash, existing_hash)
+    for news_id, existing_value in existing:
+        distance = (value ^ existing_value).bit_count()
         if distance <= threshold:
             logger.debug(
                 "simhash_duplicate_found",
-                new_hash=new_hash[:16],
-                existing_hash=existing_hash[:16],
+                new_hash=f"{value:x}"[:16],
+                existing_hash=f"{existing_value:x}"[:16],
                 distance=distance,
                 duplicate_of=news_id
             )
@@ -116,6 +143,37 @@ def is_duplicate_by_simhash(
     return None
 
 
+def is_duplicate_by_simhash(
+    new_hash: int,
+    existing_hashes: List[Tuple[int, Optional[int]]],
+    threshold: int = 3
+) -> Optional[int]:
+    """
+    Check if new hash is a duplicate of any existing hash.
+    
+    Args:
+        new_hash: Simhash of new article
+        existing_hashes: List of (news_id, simhash) tuples
+        threshold: Max hamming distance to consider duplicate
+    
+    Returns:
+        news_id of duplicate if found, None otherwise
+    """
+    if not new_hash:
+        return None
+    
+    return find_near_duplicate(
+        new_hash & MASK_64,
+        [(news_id, h & MASK_64) for news_id, h in existing_hashes if h],
+        threshold
+    )
+
+
+def _band_keys(value: int) -> List[int]:
+    """The LSH_BANDS band keys of a 64-bit hash, lowest bits first."""
+    return [(value >> (i * LSH_BAND_BITS)) & _BAND_MASK for i in range(LSH_BANDS)]
+
+
 def create_dedup_text(title: str, text: str, max_text_chars: int = 400) -> str:
     """
     Create text for simhash computation.
@@ -141,15 +199,86 @@ class Deduplicator:
     
     def __init__(self, simhash_threshold: int = 3):
         self.threshold = simhash_threshold
-        self._hash_cache: List[Tuple[int, str]] = []
+        # (news_id, hash value), empty hashes left out
+        self._hash_cache: List[Tuple[int, int]] = []
+        # Per band: band key -> indexes into _hash_cache
+        self._bands: List[Dict[int, List[int]]] = [{} for _ in range(LSH_BANDS)]
+        # Same entries as uint64/int64 arrays (grown by doubling) for the numpy scan
+        self._values = None
+        self._ids = None
     
-    def set_existing_hashes(self, hashes: List[Tuple[int, str]]) -> None:
+    def set_existing_hashes(self, hashes: List[Tuple[int, Optional[int]]]) -> None:
         """Set existing hashes from DB for comparison."""
-        self._hash_cache = hashes
+        self._hash_cache = [(news_id, simhash & MASK_64) for news_id, simhash in hashes if simhash]
+        self._bands = [{} for _ in range(LSH_BANDS)]
+        for i, (_, value) in enumerate(self._hash_cache):
+            self._index_bands(i, value)
+        
+        if HAS_NUMPY:
+            capacity = max(NUMPY_MIN_HASHES, 2 * len(self._hash_cache))
+            self._values = np.zeros(capacity, dtype=np.uint64)
+            self._ids = np.zeros(capacity, dtype=np.int64)
+            for i, (news_id, value) in enumerate(self._hash_cache):
+                self._values[i] = value
+                self._ids[i] = news_id
     
-    def add_hash(self, news_id: int, simhash: str) -> None:
+    def add_hash(self, news_id: int, simhash: Optional[int]) -> None:
         """Add new hash to cache."""
-        self._hash_cache.append((news_id, simhash))
+        if not simhash:
+            return
+        value = simhash & MASK_64
+        self._hash_cache.append((news_id, value))
+        self._index_bands(len(self._hash_cache) - 1, value)
+        
+        if HAS_NUMPY:
+            count = len(self._hash_cache)
+            if self._values is None or count > len(self._values):
+                capacity = max(NUMPY_MIN_HASHES, 2 * count)
+                values = np.zeros(capacity, dtype=np.uint64)
+                ids = np.zeros(capacity, dtype=np.int64)
+                if self._values is not None:
+                    values[:count - 1] = self._values[:count - 1]
+                    ids[:count - 1] = self._ids[:count - 1]
+                self._values, self._ids = values, ids
+            self._values[count - 1] = value
+            self._ids[count - 1] = news_id
+    
+    def _index_bands(self, i: int, value: int) -> None:
+        """File _hash_cache[i] under each of its band keys."""
+        for band, key in zip(self._bands, _band_keys(value)):
+            band.setdefault(key, []).append(i)
+    
+    def _find_near_duplicate_lsh(self, value: int) -> Optional[int]:
+        """find_near_duplicate over the hashes sharing at least one band with value."""
+        candidates = set()
+        for band, key in zip(self._bands, _band_keys(value)):
+            candidates.update(band.get(key, ()))
+        return find_near_duplicate(
+            value,
+            [self._hash_cache[i] for i in sorted(candidates)],
+            self.threshold
+        )
+    
+    def _find_near_duplicate_np(self, value: int) -> Optional[int]:
+        """find_near_duplicate over the numpy arrays, NUMPY_SCAN_BLOCK hashes per XOR + popcount."""
+        count = len(self._hash_cache)
+        target = np.uint64(value)
+        for start in range(0, count, NUMPY_SCAN_BLOCK):
+            stop = min(count, start + NUMPY_SCAN_BLOCK)
+            distances = _popcount64(self._values[start:stop] ^ target)
+            hits = np.flatnonzero(distances <= self.threshold)
+            if hits.size:
+                i = start + int(hits[0])
+                news_id = int(self._ids[i])
+                logger.debug(
+                    "simhash_duplicate_found",
+                    new_hash=f"{value:x}"[:16],
+                    existing_hash=f"{int(self._values[i]):x}"[:16],
+                    distance=int(distances[hits[0]]),
+                    duplicate_of=news_id
+                )
+                return news_id
+        return None
     
     def check_duplicate(self, title: str, text: str) -> Optional[int]:
         """
@@ -159,15 +288,26 @@ class Deduplicator:
             news_id of duplicate or None
         """
         dedup_text = create_dedup_text(title, text)
-        new_hash = compute_simhash(dedup_text)
+        return self.find_duplicate(compute_simhash(dedup_text))
+    
+    def find_duplicate(self, simhash: int) -> Optional[int]:
+        """
+        Check an already computed simhash against the cache.
         
-        return is_duplicate_by_simhash(
-            new_hash,
-            self._hash_cache,
-            self.threshold
-        )
+        Returns:
+            news_id of duplicate or None
+        """
+        value = simhash & MASK_64
+        if not value:
+            return None
+        if self.threshold < LSH_BANDS:
+            return self._find_near_duplicate_lsh(value)
+        # Wider thresholds can differ in every band: full scan
+        if HAS_NUMPY and len(self._hash_cache) >= NUMPY_MIN_HASHES:
+            return self._find_near_duplicate_np(value)
+        return find_near_duplicate(value, self._hash_cache, self.threshold)
     
-    def compute_hash(self, title: str, text: str) -> str:
+    def compute_hash(self, title: str, text: str) -> int:
         """Compute simhash for an article."""
         dedup_text = create_dedup_text(title, text)
         return compute_simhash(dedup_text)
@@ -1,5 +1,6 @@
 """Async database engine and session management."""
 from pathlib import Path
+from sqlalchemy import inspect, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -26,12 +27,35 @@ class DatabaseEngine:
         # Create async engine
         connect_args = {}
         if "sqlite" in self.database_url:
-            connect_args = {"check_same_thread": False}
+            connect_args = {
+                "check_same_thread": False,
+                # Per-connection prepared statement cache (sqlite3 default: 128)
+                "cached_statements": 512,
+            }
+        
+        # One long-lived pool for the whole app. A SQLite file has a single
+        # writer, so extra connections only add "database is locked" waits.
+        # 5 + 5 overflow still covers an admin command's concurrent reads
+        # (/stats gathers 4) next to the news cycle. A server database gets a
+        # larger pool; stale connections are pinged and recycled instead of
+        # failing the first query after idle.
+        pool_args = {}
+        if "sqlite" in self.database_url:
+            if ":memory:" not in self.database_url:
+                pool_args = {"pool_size": 5, "max_overflow": 5}
+        else:
+            pool_args = {
+                "pool_size": 20,
+                "max_overflow": 40,
+                "pool_pre_ping": True,
+                "pool_recycle": 3600,
+            }
         
         self._engine = create_async_engine(
             self.database_url,
             echo=False,
             connect_args=connect_args,
+            **pool_args,
         )
         
         # Create session factory
@@ -44,6 +68,7 @@ class DatabaseEngine:
         # Create all tables
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(_add_missing_columns)
     
     async def close(self) -> None:
         """Close database engine."""
@@ -62,6 +87,15 @@ class DatabaseEngine:
         return self._engine
 
 
+def _add_missing_columns(conn) -> None:
+    """Add columns introduced after a table was first created (create_all skips existing tables)."""
+    news_columns = {c["name"] for c in inspect(conn).get_columns("news")}
+    if "simhash_value" not in news_columns:
+        # Replaces the hex TEXT simhash column, which is no longer written
+        conn.execute(text("ALTER TABLE news ADD COLUMN simhash_value BIGINT"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_news_simhash_value ON news (simhash_value)"))
+
+
 # Global engine instance
 _db_engine: DatabaseEngine | None = None
 
@@ -1,12 +1,14 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import httpx
+import html
 import re
 import json
 import logging
 import feedparser
 from urllib.parse import urljoin, urlparse
 import time
-from typing import Set, List, Dict
+from typing import Set, List, Dict, Optional
 
 # Setup logging
 logging.basicConfig(
@@ -32,22 +34,27 @@ DEFAULT_SOURCES = [
     {"name": "МЧС России", "url": "http://www.mchs.gov.ru/news/rss/", "category": "emergency", "region": "Federal"},
 ]
 
-def extract_rss_from_subscribe(url: str) -> Set[str]:
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
+
+# Feeds downloaded at once during validation
+MAX_CONCURRENT = 32
+
+# Catalog entries read "Канал сайта: <site> <rss_url>" once tags are stripped
+_TAG = re.compile(r"<[^>]*>")
+_RSS_PATTERN = re.compile(r"Канал сайта:\s*(\S+)\s+(\S+)")
+
+async def extract_rss_from_subscribe(client: httpx.AsyncClient, url: str) -> Set[str]:
     logger.info(f"Scraping {url}...")
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-        response = requests.get(url, headers=headers, timeout=15)
+        response = await client.get(url)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, "html.parser")
-        text = soup.get_text("\n")
+        # Tags become line breaks, as with get_text("\n"), without building a tree
+        text = _TAG.sub("\n", response.text)
 
         rss_urls = set()
-        # Look for pattern "Канал сайта: <site> <rss_url>"
-        pattern = re.compile(r"Канал сайта:\s*(\S+)\s+(\S+)", re.MULTILINE)
-
-        for match in pattern.finditer(text):
-            site_url, rss_url = match.groups()
+        for match in _RSS_PATTERN.finditer(text):
+            site_url, rss_url = map(html.unescape, match.groups())
             if rss_url.startswith("http") and validate_domain(rss_url):
                 rss_urls.add(rss_url)
         
@@ -67,38 +74,56 @@ def validate_domain(url: str) -> bool:
     except:
         return False
 
-def validate_feed(url: str) -> bool:
+async def fetch_feed(client: httpx.AsyncClient, url: str) -> Optional[bytes]:
+    """Raw feed body, or None if the request fails."""
+    logger.info(f"Validating {url}...")
     try:
-        # Fast check with HEAD or short timeout GET
-        # Using feedparser directly is safer
-        logger.info(f"Validating {url}...")
-        feed = feedparser.parse(url)
-        if feed.entries and len(feed.entries) > 0:
-            return True
-        return False
+        response = await client.get(url)
+        response.raise_for_status()
+        return response.content
+    except Exception as e:
+        logger.debug(f"Error fetching {url}: {e}")
+        return None
+
+async def fetch_feeds(client: httpx.AsyncClient, urls: List[str]) -> Dict[str, Optional[bytes]]:
+    """Download all feeds, at most MAX_CONCURRENT requests in flight."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+
+    async def fetch_with_semaphore(url: str) -> Optional[bytes]:
+        async with semaphore:
+            return await fetch_feed(client, url)
+
+    bodies = await asyncio.gather(*[fetch_with_semaphore(url) for url in urls])
+    return dict(zip(urls, bodies))
+
+def validate_feed(url: str, content: Optional[bytes]) -> Optional[str]:
+    """Feed title (or domain) if content is a feed with entries, None otherwise."""
+    if not content:
+        return None
+    try:
+        feed = feedparser.parse(content)
+        if not feed.entries:
+            return None
+        return feed.feed.get('title', urlparse(url).netloc)
     except:
-        return False
+        return None
 
-def generate_source_config(rss_urls: Set[str]) -> List[Dict]:
+def generate_source_config(feeds: Dict[str, Optional[bytes]]) -> List[Dict]:
     sources = []
     # Add defaults first
     sources.extend(DEFAULT_SOURCES)
     
     seen_urls = {s['url'] for s in sources}
+    pending = {url: content for url, content in feeds.items() if url not in seen_urls}
+    
+    # feedparser is pure-Python and CPU-bound: parse feeds on all cores
+    with ProcessPoolExecutor() as executor:
+        titles = executor.map(validate_feed, pending, pending.values(), chunksize=8)
+        validated = dict(zip(pending, titles))
     
     validated_count = 0
-    for url in rss_urls:
-        if url in seen_urls:
-            continue
-            
-        if validate_feed(url):
-            # Try to extract name from feed or url
-            try:
-                feed = feedparser.parse(url)
-                title = feed.feed.get('title', urlparse(url).netloc)
-            except:
-                title = urlparse(url).netloc
-                
+    for url, title in validated.items():
+        if title is not None:
             sources.append({
                 "name": title[:50], # Limit name length
                 "url": url,
@@ -114,14 +139,23 @@ def generate_source_config(rss_urls: Set[str]) -> List[Dict]:
     logger.info(f"Total valid sources: {len(sources)}")
     return sources
 
-def main():
-    all_rss = set()
-    for url in CATALOG_URLS:
-        all_rss |= extract_rss_from_subscribe(url)
-    
-    logger.info(f"Total unique RSS candidates: {len(all_rss)}")
+async def main_async():
+    async with httpx.AsyncClient(
+        headers=HEADERS,
+        timeout=15,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=MAX_CONCURRENT)
+    ) as client:
+        found = await asyncio.gather(*[extract_rss_from_subscribe(client, url) for url in CATALOG_URLS])
+        all_rss = set().union(*found)
+        
+        logger.info(f"Total unique RSS candidates: {len(all_rss)}")
+        
+        # Defaults are always included, no need to download them
+        candidates = sorted(all_rss - {s['url'] for s in DEFAULT_SOURCES})
+        feeds = await fetch_feeds(client, candidates)
     
-    final_config = generate_source_config(all_rss)
+    final_config = generate_source_config(feeds)
     
     # Save to JSON
     with open('sources.json', 'w', encoding='utf-8') as f:
@@ -129,5 +163,8 @@ def main():
     
     logger.info("Saved to sources.json")
 
+def main():
+    asyncio.run(main_async())
+
 if __name__ == "__main__":
     main()
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 
 from config_loader import KeywordsConfig, WeightsConfig
 from logging_setup import get_logger
+from phrases import PhraseMatcher, matcher_for
 
 logger = get_logger("pipeline.filter1")
 
@@ -33,6 +34,15 @@ class KeywordFilter:
         self.keywords = keywords
         self.weights = weights
         self.threshold = threshold
+        # All negative and positive keywords, found in a single pass per text
+        self._matcher = PhraseMatcher(
+            list(keywords.negative) + [kw for kws in keywords.positive.values() for kw in kws]
+        )
+        self._negative = [(kw, kw.lower()) for kw in keywords.negative]
+        self._positive = [
+            (category, getattr(weights, category, 0), [(kw, kw.lower()) for kw in kws])
+            for category, kws in keywords.positive.items()
+        ]
     
     def score(self, text: str) -> FilterResult:
         """
@@ -59,21 +69,20 @@ class KeywordFilter:
         negative_matches = []
         categories_matched = []
         
+        found = self._matcher.found(text_lower)
+        
         # Check negative keywords first (high priority discard)
-        for keyword in self.keywords.negative:
-            kw_lower = keyword.lower()
-            if kw_lower in text_lower:
+        for keyword, kw_lower in self._negative:
+            if kw_lower in found:
                 score += self.weights.negative  # Usually negative value
                 negative_matches.append(keyword)
         
         # Check positive keywords by category
-        for category, keywords in self.keywords.positive.items():
-            weight = getattr(self.weights, category, 0)
+        for category, weight, keywords in self._positive:
             category_matched = False
             
-            for keyword in keywords:
-                kw_lower = keyword.lower()
-                if kw_lower in text_lower:
+            for keyword, kw_lower in keywords:
+                if kw_lower in found:
                     if not category_matched:
                         # Count each category only once for scoring
                         score += weight
@@ -144,17 +153,16 @@ class KeywordFilter:
             if not (has_event and has_object):
                 # Check for strong event override BEFORE failing
                 if strong_event_override_enabled and strong_event_override_phrases:
-                    combined_lower = combined.lower()
-                    for phrase in strong_event_override_phrases:
-                        if phrase.lower() in combined_lower:
-                            logger.info(
-                                "filter1_strong_override",
-                                trace_id=trace_id,
-                                matched_phrase=phrase,
-                                categories_matched=result.categories_matched
-                            )
-                            decision_code = "STRONG_OVERRIDE"
-                            return True, result, decision_code
+                    matched = matcher_for(tuple(strong_event_override_phrases)).matches(combined.lower())
+                    if matched:
+                        logger.info(
+                            "filter1_strong_override",
+                            trace_id=trace_id,
+                            matched_phrase=matched[0],
+                            categories_matched=result.categories_matched
+                        )
+                        decision_code = "STRONG_OVERRIDE"
+                        return True, result, decision_code
                 
                 decision_code = "COMBO_RULE_FAILED"
                 logger.info(
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import logging
+import time
+from typing import Optional, Dict, List
+
+from database import db
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    HAS_EMBEDDINGS = True
+except ImportError:
+    HAS_EMBEDDINGS = False
+    logger.warning("sentence-transformers/numpy not installed: semantic cache uses exact match only")
+
+
+class SemanticCache:
+    """Cache of LLM classification results for near-duplicate articles.
+
+    Lookup order:
+      1. exact match on sha256 of the normalized text (always available)
+      2. cosine similarity over sentence embeddings (if sentence-transformers is installed)
+
+    Entries are persisted in SQLite and mirrored in memory; the embedding
+    matrix is kept L2-normalized so a lookup is a single matrix-vector product.
+    Entries older than ttl_days are ignored on lookup, and the matrix is
+    preallocated (grown by doubling) and capped at max_entries rows.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        threshold: float = 0.92,
+        ttl_days: int = 7,
+        max_entries: int = 50000
+    ):
+        self.model_name = model_name
+        self.threshold = threshold
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self._model = None
+        self._model_failed = False  # model couldn't be loaded: no more attempts
+
+        # text_hash -> (result, created_at)
+        self._by_hash: Dict[str, tuple] = {}
+        # Matrix rows: the first _size rows of _matrix are in use, in insertion order
+        self._hashes: List[str] = []
+        self._matrix = None  # np.ndarray (capacity, dim), rows L2-normalized
+        self._created = None  # np.ndarray (capacity,) created_at per row
+        self._size = 0
+
+        self._init_table()
+        self._load()
+
+    def _init_table(self):
+        with db.get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS semantic_cache (
+                    text_hash TEXT PRIMARY KEY,
+                    embedding BLOB,
+                    response TEXT NOT NULL,
+                    created_at INTEGER NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_semantic_cache_created ON semantic_cache(created_at)")
+
+    def _load(self):
+        cutoff = int(time.time()) - self.ttl_seconds
+        with db.get_connection() as conn:
+            conn.execute("DELETE FROM semantic_cache WHERE created_at < ?", (cutoff,))
+            rows = conn.execute(
+                "SELECT text_hash, embedding, response, created_at FROM semantic_cache ORDER BY created_at"
+            ).fetchall()
+
+        for row in rows:
+            self._by_hash[row['text_hash']] = (json.loads(row['response']), row['created_at'])
+            if HAS_EMBEDDINGS and row['embedding'] is not None:
+                self._append_row(row['text_hash'], np.frombuffer(row['embedding'], dtype=np.float32), row['created_at'])
+        logger.info(f"Semantic cache loaded: {len(self._by_hash)} entries")
+
+    def _cutoff(self) -> int:
+        return int(time.time()) - self.ttl_seconds
+
+    def _append_row(self, key: str, embedding, created_at: int):
+        """Add an embedding row, growing the matrix by doubling (evicting once at max_entries)."""
+        if self._matrix is None:
+            capacity = min(self.max_entries, 1024)
+            self._matrix = np.zeros((capacity, embedding.shape[0]), dtype=np.float32)
+            self._created = np.zeros(capacity, dtype=np.int64)
+        elif self._size == len(self._matrix):
+            if self._size >= self.max_entries:
+                self._evict()
+            if self._size == len(self._matrix):
+                capacity = min(self.max_entries, 2 * len(self._matrix))
+                matrix = np.zeros((capacity, self._matrix.shape[1]), dtype=np.float32)
+                created = np.zeros(capacity, dtype=np.int64)
+                matrix[:self._size] = self._matrix[:self._size]
+                created[:self._size] = self._created[:self._size]
+                self._matrix, self._created = matrix, created
+
+        self._matrix[self._size] = embedding
+        self._created[self._size] = created_at
+        self._hashes.append(key)
+        self._size += 1
+
+    def _evict(self):
+        """Drop expired rows; if none expired, the oldest half of the matrix."""
+        keep = np.flatnonzero(self._created[:self._size] >= self._cutoff())
+        if len(keep) == self._size:
+            keep = keep[self._size // 2:]
+        for i in set(range(self._size)) - set(keep.tolist()):
+            entry = self._by_hash.get(self._hashes[i])
+            # Keep entries re-stored after this row was written
+            if entry is not None and entry[1] <= self._created[i]:
+                del self._by_hash[self._hashes[i]]
+        self._matrix[:len(keep)] = self._matrix[keep]
+        self._created[:len(keep)] = self._created[keep]
+        self._hashes = [self._hashes[i] for i in keep]
+        self._size = len(keep)
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        return hashlib.sha256(" ".join(text.lower().split()).encode("utf-8")).hexdigest()
+
+    def embed(self, text: str):
+        """L2-normalized float32 embedding of text, or None if embeddings are unavailable."""
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: List[str]) -> list:
+        """Embeddings for several texts in one batched encoder call (Nones if unavailable).
+
+        Encoder failures (model download, OOM in encode) are logged and give
+        Nones too, so only the semantic layer is lost, not the batch.
+        """
+        if not HAS_EMBEDDINGS or not texts or self._model_failed:
+            return [None] * len(texts)
+        try:
+            if self._model is None:
+                self._model = SentenceTransformer(self.model_name)
+            matrix = self._model.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
+        except Exception as e:
+            if self._model is None:
+                self._model_failed = True
+                logger.error(f"Embedding model {self.model_name} not available, semantic cache disabled: {e}")
+            else:
+                logger.error(f"Error embedding {len(texts)} texts: {e}")
+            return [None] * len(texts)
+        return list(matrix.astype(np.float32))
+
+    def get(self, text: str, embedding=None) -> Optional[dict]:
+        """Return a cached result for text (or a semantically similar text)."""
+        key = self.text_hash(text)
+        cutoff = self._cutoff()
+        hit = self._by_hash.get(key)
+        if hit is not None and hit[1] >= cutoff:
+            return hit[0]
+
+        if not self._size:
+            return None
+        if embedding is None:
+            embedding = self.embed(text)
+        if embedding is None:
+            return None
+
+        scores = self._matrix[:self._size] @ embedding
+        scores[self._created[:self._size] < cutoff] = -1.0  # expired rows never match
+        best = int(scores.argmax())
+        if scores[best] >= self.threshold:
+            logger.debug(f"Semantic cache hit (similarity {scores[best]:.3f})")
+            hit = self._by_hash.get(self._hashes[best])
+            return hit[0] if hit is not None else None
+        return None
+
+    def set(self, text: str, result: dict, embedding=None):
+        """Store a result for text."""
+        key = self.text_hash(text)
+        if embedding is None:
+            embedding = self.embed(text)
+
+        blob = embedding.tobytes() if embedding is not None else None
+        created_at = int(time.time())
+        with db.get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO semantic_cache (text_hash, embedding, response, created_at) VALUES (?, ?, ?, ?)",
+                (key, blob, json.dumps(result, ensure_ascii=False), created_at)
+            )
+
+        # New or expired key: its old row (if any) no longer matches, add a fresh one
+        previous = self._by_hash.get(key)
+        self._by_hash[key] = (result, created_at)
+        if embedding is not None and (previous is None or previous[1] < self._cutoff()):
+            self._append_row(key, embedding, created_at)
@@ -1,4 +1,5 @@
 """LLM usage monitoring and statistics (v1.7.0)."""
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Any
 from db_pkg import get_session, LLMUsageRepository, ConfigRepository
@@ -60,6 +61,45 @@ class CircuitBreaker:
         cls._errors = [t for t in cls._errors if t > cutoff]
 
 
+class UsageStatsCache:
+    """Short-lived cache for LLM usage aggregates shown in admin commands.
+    
+    /health and /guardrails are often hit back-to-back; within the TTL
+    they reuse the last SUM/COUNT instead of re-aggregating llm_usage.
+    Budget enforcement (LLMMonitor.check_budget) stays uncached.
+    """
+    
+    _ttl_seconds: float = 15.0
+    _entries: Dict[tuple, tuple[float, Any]] = {}
+    
+    @classmethod
+    async def _get(cls, key: tuple, query, session, *args):
+        now = time.monotonic()
+        cached = cls._entries.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+        value = await query(session, *args)
+        cls._entries[key] = (now + cls._ttl_seconds, value)
+        return value
+    
+    @classmethod
+    async def get_daily_cost(cls, session) -> float:
+        """Cached LLMUsageRepository.get_daily_cost (keyed by UTC day)."""
+        key = ("daily_cost", datetime.utcnow().date())
+        return await cls._get(key, LLMUsageRepository.get_daily_cost, session)
+    
+    @classmethod
+    async def get_recent_errors(cls, session, minutes: int = 5) -> int:
+        """Cached LLMUsageRepository.get_recent_errors."""
+        key = ("recent_errors", minutes)
+        return await cls._get(key, LLMUsageRepository.get_recent_errors, session, minutes)
+    
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all cached values."""
+        cls._entries = {}
+
+
 class LLMMonitor:
     """Monitor for LLM usage and guardrails."""
     
@@ -0,0 +1,142 @@
+import logging
+import os
+import re
+from typing import Optional
+
+from config import config
+from database import db
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fasttext
+    HAS_FASTTEXT = True
+except ImportError:
+    HAS_FASTTEXT = False
+
+try:
+    import numpy as np
+    import onnxruntime
+    HAS_ONNXRUNTIME = True
+except ImportError:
+    HAS_ONNXRUNTIME = False
+
+RELEVANT_LABEL = "__label__relevant"
+IRRELEVANT_LABEL = "__label__irrelevant"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def prepare_text(text: str) -> str:
+    """Single-line lowercase text, as fastText expects for both training and prediction."""
+    return _WHITESPACE.sub(" ", text.lower()).strip()
+
+
+class LocalClassifier:
+    """Small local relevant/irrelevant classifier run before the LLM.
+
+    Loads either a (quantized) fastText model (.bin/.ftz) or an ONNX model
+    with a single string input, served on the onnxruntime CPU provider.
+    Without a model file or runtime, predict() returns None and every
+    article goes on to the LLM as before.
+    """
+
+    def __init__(self, model_path: str = None):
+        self.model_path = model_path or config.LOCAL_CLASSIFIER_PATH
+        self._fasttext = None
+        self._onnx = None
+        self._onnx_input = None
+        self._load()
+
+    @property
+    def available(self) -> bool:
+        return self._fasttext is not None or self._onnx is not None
+
+    def _load(self):
+        if not self.model_path or not os.path.exists(self.model_path):
+            logger.info("Local classifier model not found: all pre-filtered articles go to the LLM")
+            return
+
+        try:
+            if self.model_path.endswith(".onnx"):
+                if not HAS_ONNXRUNTIME:
+                    logger.warning("onnxruntime not installed: local classifier disabled")
+                    return
+                self._onnx = onnxruntime.InferenceSession(self.model_path, providers=["CPUExecutionProvider"])
+                self._onnx_input = self._onnx.get_inputs()[0].name
+            else:
+                if not HAS_FASTTEXT:
+                    logger.warning("fasttext not installed: local classifier disabled")
+                    return
+                self._fasttext = fasttext.load_model(self.model_path)
+            logger.info(f"Local classifier loaded: {self.model_path}")
+        except Exception as e:
+            logger.warning(f"Local classifier not available: {e}")
+            self._fasttext = None
+            self._onnx = None
+
+    def predict(self, text: str) -> Optional[float]:
+        """Probability that text is relevant, or None if no model is loaded."""
+        if not self.available:
+            return None
+
+        text = prepare_text(text)
+        if self._fasttext is not None:
+            labels, probs = self._fasttext.predict(text, k=2)
+            return float(dict(zip(labels, probs)).get(RELEVANT_LABEL, 0.0))
+
+        # ONNX classifiers (e.g. skl2onnx) output [label, probabilities]
+        outputs = self._onnx.run(None, {self._onnx_input: np.array([[text]])})
+        probs = outputs[-1][0]
+        if isinstance(probs, dict):
+            return float(probs.get(1, probs.get("relevant", 0.0)))
+        return float(probs[-1])
+
+
+def export_training_data(path: str, threshold: float) -> int:
+    """Write fastText training lines for all articles with an LLM verdict.
+
+    Articles the LLM scored at or above threshold are labelled relevant,
+    the rest irrelevant. Articles rejected by the keyword filter or by this
+    classifier, or whose LLM call failed, have no verdict and are left out,
+    so retraining never learns from the classifier's own rejections.
+    Returns the number of lines written.
+    """
+    with db.get_connection() as conn:
+        rows = conn.execute("""
+            SELECT title, content, llm_relevance AS relevance
+            FROM articles
+            WHERE llm_relevance IS NOT NULL
+        """).fetchall()
+
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            relevant = row['relevance'] >= threshold
+            label = RELEVANT_LABEL if relevant else IRRELEVANT_LABEL
+            text = prepare_text(row['title'] + " " + (row['content'] or "")[:1500])
+            f.write(f"{label} {text}\n")
+    return len(rows)
+
+
+def train(model_path: str = None, threshold: float = None) -> str:
+    """Train and quantize a fastText model on the article history."""
+    if not HAS_FASTTEXT:
+        raise RuntimeError("fasttext is not installed")
+
+    model_path = model_path or config.LOCAL_CLASSIFIER_PATH
+    threshold = config.LLM_RELEVANCE_THRESHOLD if threshold is None else threshold
+    data_path = model_path + ".train.txt"
+
+    count = export_training_data(data_path, threshold)
+    logger.info(f"Training local classifier on {count} articles")
+
+    model = fasttext.train_supervised(input=data_path, epoch=25, lr=0.5, wordNgrams=2, minn=2, maxn=5, dim=50)
+    model.quantize(input=data_path, retrain=True)
+    model.save_model(model_path)
+    logger.info(f"Local classifier saved: {model_path}")
+    return model_path
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    train()
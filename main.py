@@ -112,11 +112,11 @@ async def process_news_cycle(broadcaster: Optional[Broadcaster] = None):
         }
         
         new_items = []
-        url_params = set(config.dedup.url_params_to_remove)
+        url_params = config.dedup.url_params_to_remove_set
         
         for item in raw_items:
             try:
-                normalized = normalize_news_item(item, list(url_params))
+                normalized = normalize_news_item(item, url_params)
                 
                 # URL dedup
                 async with get_session() as session:
@@ -144,17 +144,12 @@ async def process_news_cycle(broadcaster: Optional[Broadcaster] = None):
                     )
                     continue
                 
-                # Simhash dedup
-                duplicate_of = deduplicator.check_duplicate(
-                    normalized["title"],
-                    normalized["text"]
-                )
-                
-                # Compute simhash for storage
+                # Simhash dedup (the same hash is stored with the item)
                 normalized["simhash"] = deduplicator.compute_hash(
                     normalized["title"],
                     normalized["text"]
                 )
+                duplicate_of = deduplicator.find_duplicate(normalized["simhash"])
                 
                 if duplicate_of:
                     # Save as duplicate with canonical reference (per ТЗ)
@@ -167,7 +162,7 @@ async def process_news_cycle(broadcaster: Optional[Broadcaster] = None):
                             "url_normalized": normalized["url_normalized"],
                             "published_at": normalized.get("published_at"),
                             "collected_at": datetime.utcnow(),
-                            "simhash": normalized["simhash"],
+                            "simhash_value": normalized["simhash"],
                             "canonical_news_id": duplicate_of,
                             "status": "duplicate",
                         })
@@ -234,14 +229,14 @@ async def process_news_cycle(broadcaster: Optional[Broadcaster] = None):
                         "published_at": item.get("published_at"),
                         "collected_at": datetime.utcnow(),
                         "region": item.get("region"),
-                        "simhash": item.get("simhash"),
+                        "simhash_value": item.get("simhash"),
                         "status": "raw",
                     })
                     await session.commit()
                     news_id = news.id
                     
                     # Add to deduplicator cache
-                    deduplicator.add_hash(news_id, item.get("simhash", ""))
+                    deduplicator.add_hash(news_id, item.get("simhash", 0))
 
                 # FIRST RUN CHECK: If first run, mark as processed/skipped but DO NOT analyze or signal
                 # This prevents flooding 5 signals from old news on startup
@@ -578,6 +573,7 @@ async def main():
     # Load config
     config_loader = get_config_loader()
     config = config_loader.load()
+    config_loader.watch()
     logger.info("config_loaded", sources=len(config.sources))
     
     # Initialize database
@@ -733,6 +729,13 @@ if __name__ == "__main__":
     signal.signal(signal.SIGTERM, sigterm_handler)
     signal.signal(signal.SIGINT, sigterm_handler)
     
+    # Faster event loop where available (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     try:
         asyncio.run(main())
     except (KeyboardInterrupt, SystemExit):
@@ -9,10 +9,27 @@ from sqlalchemy import (
     Text, Boolean, ForeignKey, Index
 )
 from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.types import TypeDecorator
 
 Base = declarative_base()
 
 
+class UInt64(TypeDecorator):
+    """Unsigned 64-bit int stored in a signed BIGINT/INTEGER column (two's complement)."""
+    impl = BigInteger
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is not None and value >= 1 << 63:
+            value -= 1 << 64
+        return value
+    
+    def process_result_value(self, value, dialect):
+        if value is not None and value < 0:
+            value += 1 << 64
+        return value
+
+
 class News(Base):
     """Collected news articles."""
     __tablename__ = "news"
@@ -27,7 +44,7 @@ class News(Base):
     collected_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     region = Column(String(200), nullable=True)
     filter1_score = Column(Integer, default=0)
-    simhash = Column(String(32), nullable=True, index=True)
+    simhash_value = Column(UInt64, nullable=True, index=True)
     # Dedup: if this is a duplicate, points to the canonical news_id
     canonical_news_id = Column(Integer, ForeignKey("news.id"), nullable=True)
     status = Column(String(50), default="raw", index=True)
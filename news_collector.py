@@ -2,11 +2,12 @@ import feedparser
 import requests
 import random
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import List, Optional
 from datetime import datetime
 import logging
+import threading
 from models import NewsArticle
-from config import config
+from config import config, RssSource, unique_by_url
 from utils import generate_article_id, clean_text, parse_rss_date
 from database import db
 
@@ -30,6 +31,12 @@ class NewsCollector:
     def __init__(self):
         self.sources = config.RSS_SOURCES
         self.session = requests.Session()
+        # Ids already stored, prefetched once per collection cycle
+        self._known_ids: Optional[set] = None
+        # Content hashes taken by any feed in the current cycle: feeds are
+        # saved only once fully parsed, so article_hash_exists can't see them yet
+        self._seen_hashes: Optional[set] = None
+        self._seen_lock = threading.Lock()
     
     def _get_random_user_agent(self) -> str:
         return random.choice(USER_AGENTS)
@@ -48,6 +55,10 @@ class NewsCollector:
         
         logger.info(f"🚀 Collection from {total} sources (20 workers)...")
         
+        # Older articles that reappear in a feed are dropped by INSERT OR IGNORE
+        self._known_ids = db.recent_article_ids()
+        self._seen_hashes = set()
+        
         with ThreadPoolExecutor(max_workers=20) as executor:
             future_to_source = {executor.submit(self.collect_from_rss, source): source for source in self.sources}
             
@@ -60,15 +71,17 @@ class NewsCollector:
                     articles = future.result(timeout=15)
                     all_articles.extend(articles)
                     if articles:
-                        logger.info(f"[{progress}%] ✓ {source['name']}: {len(articles)}")
+                        logger.info(f"[{progress}%] ✓ {source.name}: {len(articles)}")
                 except Exception as e:
-                    logger.debug(f"[{progress}%] ✗ {source['name']}: {str(e)[:40]}")
+                    logger.debug(f"[{progress}%] ✗ {source.name}: {str(e)[:40]}")
         
+        self._known_ids = None
+        self._seen_hashes = None
         elapsed = time.time() - start_time
         logger.info(f"⚡ DONE: {len(all_articles)} articles in {elapsed:.1f}s")
         return all_articles
     
-    def collect_from_rss(self, source: Dict) -> List[NewsArticle]:
+    def collect_from_rss(self, source: RssSource) -> List[NewsArticle]:
         articles = []
         try:
             user_agent = self._get_random_user_agent()
@@ -79,29 +92,44 @@ class NewsCollector:
             socket.setdefaulttimeout(10)
             
             try:
-                feed = feedparser.parse(source['url'])
+                feed = feedparser.parse(source.url)
                 if not feed.entries:
-                    logger.warning(f"No entries found in {source['name']}")
+                    logger.warning(f"No entries found in {source.name}")
                     return articles
                 
+                parsed = []
+                seen_hashes = self._seen_hashes if self._seen_hashes is not None else set()
                 for entry in feed.entries[:config.MAX_ARTICLES_PER_CHECK]:
                     try:
                         article = self._parse_rss_entry(entry, source)
-                        if article:
-                            articles.append(article)
+                        # Same content twice in this cycle: keep the first
+                        if article and self._claim_hash(seen_hashes, article.content_hash):
+                            parsed.append(article)
                     except Exception as e:
-                        logger.error(f"Error parsing entry from {source['name']}: {e}")
+                        logger.error(f"Error parsing entry from {source.name}: {e}")
                         continue
+                
+                # One transaction for the whole feed instead of one per entry
+                saved = db.save_articles([self._article_row(a) for a in parsed])
+                articles = [a for a, ok in zip(parsed, saved) if ok]
             except socket.timeout:
-                logger.warning(f"⏱️ Timeout: {source['name']}")
+                logger.warning(f"⏱️ Timeout: {source.name}")
                 return articles
             finally:
                 socket.setdefaulttimeout(original_timeout)
         except Exception as e:
-            logger.error(f"Error fetching RSS from {source['name']}: {e}")
+            logger.error(f"Error fetching RSS from {source.name}: {e}")
         return articles
     
-    def _parse_rss_entry(self, entry, source: Dict) -> Optional[NewsArticle]:
+    def _claim_hash(self, seen_hashes: set, content_hash: str) -> bool:
+        """Add content_hash to seen_hashes; False if another entry already has it."""
+        with self._seen_lock:
+            if content_hash in seen_hashes:
+                return False
+            seen_hashes.add(content_hash)
+            return True
+    
+    def _parse_rss_entry(self, entry, source: RssSource) -> Optional[NewsArticle]:
         try:
             title = clean_text(entry.get('title', ''))
             url = entry.get('link', '')
@@ -111,7 +139,8 @@ class NewsCollector:
             
             # Level 1 Dedup: URL
             article_id = generate_article_id(url)
-            if db.article_exists(article_id):
+            known = self._known_ids
+            if (article_id in known) if known is not None else db.article_exists(article_id):
                 return None
             
             content = ''
@@ -145,27 +174,27 @@ class NewsCollector:
                 title=title,
                 url=url,
                 content=content or title,
-                source=source['name'],
-                category=source['category'],
+                source=source.name,
+                category=source.category,
                 published_at=published_at,
                 collected_at=datetime.now(),
                 content_hash=content_hash
             )
             
-            article_dict = article.model_dump()
-            article_dict['published_at'] = article_dict['published_at'].isoformat() if article_dict['published_at'] else None
-            article_dict['collected_at'] = article_dict['collected_at'].isoformat()
-            
-            if db.save_article(article_dict):
-                return article
-            return None
+            return article
         except Exception as e:
             logger.error(f"Error parsing RSS entry: {e}")
             return None
     
+    @staticmethod
+    def _article_row(article: NewsArticle) -> dict:
+        article_dict = article.model_dump()
+        article_dict['published_at'] = article_dict['published_at'].isoformat() if article_dict['published_at'] else None
+        article_dict['collected_at'] = article_dict['collected_at'].isoformat()
+        return article_dict
+    
     def add_source(self, name: str, url: str, category: str = "general"):
-        new_source = {"name": name, "url": url, "category": category}
-        self.sources.append(new_source)
+        self.sources = unique_by_url(self.sources + (RssSource(name, url, category),))
         logger.info(f"Added new source: {name}")
     
     def get_source_count(self) -> int:
@@ -6,6 +6,7 @@ from typing import List, Tuple
 from dataclasses import dataclass
 
 from logging_setup import get_logger
+from phrases import matcher_for
 
 logger = get_logger("pipeline.noise")
 
@@ -62,17 +63,11 @@ def check_noise(
     # Check title + first 800 chars of text
     check_text = f"{title.lower()} {text[:800].lower()}"
     
-    matched_terms = []
-    
-    # Check hard negative topics
-    for topic in hard_negative_topics:
-        if topic.lower() in check_text:
-            matched_terms.append(topic)
-    
-    # Check domestic noise
-    for noise in domestic_noise:
-        if noise.lower() in check_text:
-            matched_terms.append(noise)
+    # Check hard negative topics, then domestic noise
+    matched_terms = (
+        matcher_for(tuple(hard_negative_topics)).matches(check_text)
+        + matcher_for(tuple(domestic_noise)).matches(check_text)
+    )
     
     if not matched_terms:
         return NoiseResult(
@@ -83,11 +78,7 @@ def check_noise(
         )
     
     # Check for infrastructure exceptions (in full text)
-    exception_matched = False
-    for phrase in exception_infra_phrases:
-        if phrase.lower() in combined:
-            exception_matched = True
-            break
+    exception_matched = matcher_for(tuple(exception_infra_phrases)).any(combined)
     
     if exception_matched:
         logger.debug(
@@ -1,5 +1,5 @@
 """Text normalization pipeline step."""
-from typing import Dict, Any
+from typing import AbstractSet, Dict, Any
 from text import clean_html, extract_sentences, normalize_whitespace
 from urlnorm import normalize_url
 from logging_setup import get_logger
@@ -9,7 +9,7 @@ logger = get_logger("pipeline.normalize")
 
 def normalize_news_item(
     item: Dict[str, Any],
-    url_params_to_remove: list[str] = None
+    url_params_to_remove: AbstractSet[str] = None
 ) -> Dict[str, Any]:
     """
     Normalize a raw news item.
@@ -18,15 +18,14 @@ def normalize_news_item(
     
     Args:
         item: Raw item with url, title, raw_html, etc.
-        url_params_to_remove: List of URL params to strip
+        url_params_to_remove: Set of URL params to strip
     
     Returns:
         Normalized item ready for DB insertion
     """
     # Normalize URL
     url = item.get("url", "")
-    params_set = set(url_params_to_remove) if url_params_to_remove else None
-    url_normalized = normalize_url(url, params_set)
+    url_normalized = normalize_url(url, url_params_to_remove or None)
     
     # Clean title
     title = item.get("title", "")
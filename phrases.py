@@ -0,0 +1,58 @@
+"""Case-insensitive multi-phrase matching.
+
+One Aho-Corasick pass over the text finds every configured phrase
+(pyahocorasick); without it, falls back to one substring scan per phrase.
+"""
+from functools import lru_cache
+from typing import Iterable, List, Set
+
+from logging_setup import get_logger
+
+logger = get_logger("pipeline.phrases")
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+    logger.warning("pyahocorasick_missing", fallback="substring_scan")
+
+
+class PhraseMatcher:
+    """Finds which of a fixed list of phrases occur in a lowercased text."""
+
+    def __init__(self, phrases: Iterable[str]):
+        # (original, lowercased) in config order; empty phrases never match
+        self.phrases = [(p, p.lower()) for p in phrases if p]
+        self._lowered = {low for _, low in self.phrases}
+        self._automaton = None
+        if HAS_AHOCORASICK and self._lowered:
+            self._automaton = ahocorasick.Automaton()
+            for low in self._lowered:
+                self._automaton.add_word(low, low)
+            self._automaton.make_automaton()
+
+    def found(self, text_lower: str) -> Set[str]:
+        """Lowercased phrases present in text_lower."""
+        if self._automaton is not None:
+            return {low for _, low in self._automaton.iter(text_lower)}
+        return {low for low in self._lowered if low in text_lower}
+
+    def matches(self, text_lower: str) -> List[str]:
+        """Original phrases present in text_lower, in config order."""
+        if not self.phrases:
+            return []
+        found = self.found(text_lower)
+        return [p for p, low in self.phrases if low in found]
+
+    def any(self, text_lower: str) -> bool:
+        """True if at least one phrase occurs in text_lower."""
+        if self._automaton is not None:
+            return next(self._automaton.iter(text_lower), None) is not None
+        return any(low in text_lower for low in self._lowered)
+
+
+@lru_cache(maxsize=64)
+def matcher_for(phrases: tuple) -> PhraseMatcher:
+    """Shared matcher per distinct phrase list (built on first use)."""
+    return PhraseMatcher(phrases)
@@ -20,11 +20,11 @@ class NewsRepository:
         return result.scalar() is not None
     
     @staticmethod
-    async def simhash_exists(session: AsyncSession, simhash: str, threshold: int = 3) -> Optional[int]:
+    async def simhash_exists(session: AsyncSession, simhash: int, threshold: int = 3) -> Optional[int]:
         """Check if similar simhash exists. Returns news_id if found."""
         # For exact match first (most common case)
         result = await session.execute(
-            select(News.id).where(News.simhash == simhash).limit(1)
+            select(News.id).where(News.simhash_value == simhash).limit(1)
         )
         existing = result.scalar()
         if existing:
@@ -38,13 +38,13 @@ class NewsRepository:
     async def get_recent_simhashes(
         session: AsyncSession, 
         hours: int = 72
-    ) -> List[tuple[int, str]]:
+    ) -> List[tuple[int, int]]:
         """Get recent simhashes for dedup checking."""
         cutoff = datetime.utcnow() - timedelta(hours=hours)
         result = await session.execute(
-            select(News.id, News.simhash)
+            select(News.id, News.simhash_value)
             .where(and_(
-                News.simhash.isnot(None),
+                News.simhash_value.isnot(None),
                 News.collected_at >= cutoff
             ))
         )
@@ -287,15 +287,31 @@ class SignalRepository:
         return signal
     
     @staticmethod
-    async def get_recent(session: AsyncSession, days: int = 7) -> List[Signal]:
-        """Get signals from last N days."""
+    async def get_recent(
+        session: AsyncSession, 
+        days: int = 7, 
+        limit: Optional[int] = None
+    ) -> List[Signal]:
+        """Get signals from last N days (newest first, optionally limited)."""
         cutoff = datetime.utcnow() - timedelta(days=days)
-        result = await session.execute(
+        query = (
             select(Signal)
             .where(Signal.sent_at >= cutoff)
             .order_by(Signal.sent_at.desc())
         )
+        if limit is not None:
+            query = query.limit(limit)
+        result = await session.execute(query)
         return result.scalars().all()
+    
+    @staticmethod
+    async def count_recent(session: AsyncSession, days: int = 7) -> int:
+        """Count signals from last N days."""
+        cutoff = datetime.utcnow() - timedelta(days=days)
+        result = await session.execute(
+            select(func.count(Signal.id)).where(Signal.sent_at >= cutoff)
+        )
+        return result.scalar() or 0
 
     @staticmethod
     async def get_last_signal_date(session: AsyncSession) -> Optional[datetime]:
@@ -409,6 +425,17 @@ class SubscriberRepository:
             .values(is_active=is_active, last_seen_at=datetime.utcnow())
         )
     
+    @staticmethod
+    async def set_active_bulk(session: AsyncSession, chat_ids: List[int], is_active: bool) -> None:
+        """Set active status for many subscribers in a single UPDATE."""
+        if not chat_ids:
+            return
+        await session.execute(
+            update(Subscriber)
+            .where(Subscriber.chat_id.in_(chat_ids))
+            .values(is_active=is_active, last_seen_at=datetime.utcnow())
+        )
+    
     @staticmethod
     async def get_active(session: AsyncSession) -> List[Subscriber]:
         """Get all active subscribers."""
@@ -417,6 +444,14 @@ class SubscriberRepository:
         )
         return result.scalars().all()
     
+    @staticmethod
+    async def get_active_chat_ids(session: AsyncSession) -> List[int]:
+        """Get chat IDs of all active subscribers (no ORM objects loaded)."""
+        result = await session.execute(
+            select(Subscriber.chat_id).where(Subscriber.is_active == True)
+        )
+        return list(result.scalars().all())
+    
     @staticmethod
     async def count_active(session: AsyncSession) -> int:
         """Count active subscribers."""
@@ -475,6 +510,58 @@ class ConfigRepository:
                 source=source
             ))
 
+    @staticmethod
+    async def set_many(
+        session: AsyncSession,
+        items: Dict[str, str],
+        updated_by: int,
+        source: str = "import"
+    ) -> None:
+        """Upsert several config overrides in one statement and log audit.
+        
+        Equivalent to calling set() per key, but issues a single SELECT for
+        the old values and a single multi-row INSERT ... ON CONFLICT DO UPDATE.
+        """
+        from sqlalchemy.dialects.sqlite import insert
+        from models import ConfigAudit
+        
+        if not items:
+            return
+        
+        existing = await session.execute(
+            select(ConfigOverride.key, ConfigOverride.value)
+            .where(ConfigOverride.key.in_(list(items)))
+        )
+        old_values = dict(existing.all())
+        
+        now = datetime.utcnow()
+        stmt = insert(ConfigOverride).values([
+            {"key": key, "value": value, "updated_by": updated_by, "updated_at": now}
+            for key, value in items.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ConfigOverride.key],
+            set_={
+                "value": stmt.excluded.value,
+                "updated_by": stmt.excluded.updated_by,
+                "updated_at": stmt.excluded.updated_at,
+            }
+        )
+        await session.execute(stmt)
+        
+        session.add_all([
+            ConfigAudit(
+                user_id=updated_by,
+                action="set",
+                key=key,
+                old_value=old_values.get(key),
+                new_value=value,
+                source=source
+            )
+            for key, value in items.items()
+            if old_values.get(key) != value
+        ])
+
     @staticmethod
     async def log_audit(
         session: AsyncSession,
@@ -6,6 +6,7 @@ from typing import List, Tuple
 from dataclasses import dataclass
 
 from logging_setup import get_logger
+from phrases import matcher_for
 
 logger = get_logger("pipeline.resolved")
 
@@ -60,25 +61,15 @@ def check_resolved(
     # Check first 1500 chars for efficiency
     check_text = combined[:1500]
     
-    matched_phrases = []
-    ongoing_detected = False
-    
     # Check for ongoing indicators first
-    for word in allow_if_still_ongoing_words:
-        if word.lower() in check_text:
-            ongoing_detected = True
-            break
+    ongoing_detected = matcher_for(tuple(allow_if_still_ongoing_words)).any(check_text)
     
     # Check hard resolved phrases
-    for phrase in hard_resolved_phrases:
-        if phrase.lower() in check_text:
-            matched_phrases.append(phrase)
+    matched_phrases = matcher_for(tuple(hard_resolved_phrases)).matches(check_text)
     
     # Check soft resolved words (only if no hard matches yet)
     if not matched_phrases:
-        for word in soft_resolved_words:
-            if word.lower() in check_text:
-                matched_phrases.append(word)
+        matched_phrases = matcher_for(tuple(soft_resolved_words)).matches(check_text)
     
     # Decision logic
     if matched_phrases and not ongoing_detected:
@@ -19,6 +19,8 @@ MAX_ARTICLES_PER_CHECK = int(os.getenv("MAX_ARTICLES_PER_CHECK", "50"))
 # --- AI Settings ---
 RELEVANCE_THRESHOLD = float(os.getenv("RELEVANCE_THRESHOLD", "0.3"))
 PERPLEXITY_MODEL = "llama-3.1-sonar-large-128k-online"
+# Draft model tried first; empty string disables the cascade
+PERPLEXITY_MODEL_SMALL = os.getenv("PERPLEXITY_MODEL_SMALL", "llama-3.1-sonar-small-128k-online")
 PERPLEXITY_API_BASE = "https://api.perplexity.ai"
 
 # --- Keywords ---
@@ -368,7 +368,7 @@ async def handle_ui_callback(callback: CallbackQuery):
             await callback.answer("📜 Ошибок нет", show_alert=True)
             return
         if action == "reload_config":
-            get_config_loader().reload()
+            get_config_loader().reload(force=True)
             await callback.answer("✅ Конфиг перезагружен", show_alert=True)
             return
         if action in ("thresh_dec", "thresh_inc", "limit_dec", "limit_inc"):
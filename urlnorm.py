@@ -2,19 +2,26 @@
 
 # Adapted from other/3/core/normalization.py - clean_url()
 """
+from functools import lru_cache
 from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
-from typing import Set
+from typing import AbstractSet
 
 
 # Default tracking parameters to remove
-DEFAULT_PARAMS_TO_REMOVE: Set[str] = {
+DEFAULT_PARAMS_TO_REMOVE: frozenset[str] = frozenset({
     "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
     "yclid", "gclid", "fbclid", "ref", "from", "source", "rss", "tg",
     "share", "partner", "erid", "ysclid", "rs", "_openstat"
-}
+})
 
 
-def normalize_url(url: str, params_to_remove: Set[str] = None) -> str:
+@lru_cache(maxsize=32)
+def _lowered(params: frozenset) -> frozenset:
+    """Lowercased copy of a param set, built once per distinct set."""
+    return frozenset(p.lower() for p in params)
+
+
+def normalize_url(url: str, params_to_remove: AbstractSet[str] = None) -> str:
     """
     Normalize URL by removing tracking parameters.
     
@@ -29,7 +36,9 @@ def normalize_url(url: str, params_to_remove: Set[str] = None) -> str:
         return ""
     
     params_to_remove = params_to_remove or DEFAULT_PARAMS_TO_REMOVE
-    params_lower = {p.lower() for p in params_to_remove}
+    if not isinstance(params_to_remove, frozenset):
+        params_to_remove = frozenset(params_to_remove)
+    params_lower = _lowered(params_to_remove)
     
     try:
         parsed = urlparse(url)
@@ -146,9 +146,10 @@ async def get_daily_summary() -> Dict[str, Any]:
         stats = await NewsRepository.get_stats(session, days=1)
         signals_today = await SignalRepository.count_today(session)
     
+    by_status = stats.get("by_status", {})
     return {
         "collected": stats.get("total", 0),
         "signals": signals_today,
-        "filtered": stats.get("status_filtered", 0),
-        "errors": stats.get("status_error", 0) + stats.get("status_llm_failed", 0),
+        "filtered": by_status.get("filtered", 0),
+        "errors": by_status.get("error", 0) + by_status.get("llm_failed", 0),
     }